@@ -51,10 +51,19 @@ setuptools.setup(
         'Topic :: System :: Operating System Kernels :: Linux',
     ],
     install_requires = [
+        'justbases',
         'justbytes>0.08',
         'justoptions-gui',
         'six'
     ],
+    extras_require={
+        'numpy': ['numpy']
+    },
     package_dir={"": "src"},
     packages=setuptools.find_packages("src"),
+    entry_points={
+        'console_scripts': [
+            'justbytes-format = justbytes_gui._batch:main'
+        ]
+    },
     )
@@ -15,7 +15,40 @@
 
 """
 The public interface of justbytes_gui.
+
+Tkinter is imported only when show() is first called, so that the headless
+parts of the package may be imported where there is no display, and NumPy
+only when format_sizes() is.
 """
 
-from ._frame import show
 from ._version import __version__
+
+
+def show(a_range):
+    """
+    Start a simple GUI to show display options for ``a_range``.
+
+    If ``a_range`` is not a single Range, but a sequence or other iterable
+    of Ranges, show them all in a table.
+
+    :param a_range: the range or ranges to display
+    :type a_range: Range or iterable of Range
+    """
+    from ._frame import show as _show
+    _show(a_range)
+
+
+def format_sizes(values, options=None):
+    """
+    Format many numbers of bytes, using NumPy if it is installed.
+
+    :param values: the numbers of bytes
+    :type values: NumPy array or iterable of int or Range
+    :param options: the options, as from the gadgets; if None, the defaults
+    :type options: Options or NoneType
+    :returns: the strings, in order, the same as those of Range.getString()
+    :rtype: list of str
+    :raises RangeError: if the options are not a valid configuration
+    """
+    from ._bulk import format_sizes as _format_sizes
+    return _format_sizes(values, options)
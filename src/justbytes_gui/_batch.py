@@ -0,0 +1,217 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Formatting streams of byte counts, without any GUI.
+"""
+import argparse
+import itertools
+import multiprocessing
+import sys
+
+from collections import deque
+
+import justbytes
+
+from ._engine import Formatter
+from ._engine import field_labels
+from ._engine import parse_options
+
+from ._errors import GUIValueError
+
+
+# The formatter of a worker process, set up by _init_worker().
+_FORMATTER = None
+
+
+def _init_worker(texts):
+    """
+    Set up the formatter for a worker process.
+
+    :param texts: the options, as for parse_options()
+    :type texts: dict of str * str
+    """
+    global _FORMATTER # pylint: disable=global-statement
+    _FORMATTER = Formatter(parse_options(texts))
+
+
+def _format_line(formatter, line):
+    """
+    Format a line containing a number of bytes.
+
+    :param Formatter formatter: the formatter
+    :param str line: the line
+    :returns: the formatted string and an error message, one of them None
+    :rtype: tuple of (str or NoneType) * (str or NoneType)
+    """
+    try:
+        return (formatter.format(justbytes.Range(line.strip())), None)
+    except justbytes.RangeError as err:
+        return (None, str(err))
+
+
+def _format_chunk(lines):
+    """
+    Format a chunk of lines in a worker process.
+
+    :param lines: the lines
+    :type lines: list of str
+    :rtype: list of tuple of (str or NoneType) * (str or NoneType)
+    """
+    return [_format_line(_FORMATTER, line) for line in lines]
+
+
+def _chunks(lines, chunk_size):
+    """
+    Split ``lines`` into lists of at most ``chunk_size`` lines.
+
+    :param lines: the lines
+    :type lines: iterable of str
+    :param int chunk_size: the maximum size of a chunk
+    """
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if chunk == []:
+            return
+        yield chunk
+
+
+def format_lines(lines, texts, jobs=1, chunk_size=1024):
+    """
+    Format lines, each containing a number of bytes, in order.
+
+    :param lines: the lines
+    :type lines: iterable of str
+    :param texts: the options, as for parse_options()
+    :type texts: dict of str * str
+    :param jobs: number of worker processes, None for one per CPU
+    :type jobs: int or NoneType
+    :param int chunk_size: the number of lines sent to a worker at a time
+    :returns: for each line, its string and an error message, one None
+    :rtype: generator of tuple of (str or NoneType) * (str or NoneType)
+    :raises GUIValueError: if an option text is bad
+    :raises RangeError: if the options are not a valid configuration
+
+    At most two chunks per worker are in flight at any time, so memory
+    use does not depend on the number of lines.
+    """
+    formatter = Formatter(parse_options(texts))
+
+    if jobs == 1:
+        for line in lines:
+            yield _format_line(formatter, line)
+        return
+
+    jobs = multiprocessing.cpu_count() if jobs is None else jobs
+    pool = multiprocessing.Pool(jobs, _init_worker, (texts,))
+    try:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.apply_async(_format_chunk, (chunk,)))
+            if len(pending) >= 2 * jobs:
+                for result in pending.popleft().get():
+                    yield result
+        while pending:
+            for result in pending.popleft().get():
+                yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(
+       description="Format numbers of bytes, one per line, using justbytes."
+    )
+    parser.add_argument(
+       "input",
+       nargs="?",
+       default="-",
+       help="file of numbers of bytes, one per line; default is stdin"
+    )
+    parser.add_argument(
+       "--jobs",
+       type=int,
+       default=1,
+       help="number of worker processes; 0 for one per CPU; default is 1"
+    )
+    parser.add_argument(
+       "--chunk-size",
+       type=int,
+       default=1024,
+       help="lines sent to a worker process at a time"
+    )
+    options = parser.add_argument_group("justbytes options")
+    for (name, label) in sorted(field_labels().items()):
+        options.add_argument(
+           "--%s" % name.replace("_", "-"),
+           dest=name,
+           metavar="VALUE",
+           help=label
+        )
+    return parser
+
+
+def main(argv=None):
+    """
+    Format numbers of bytes from a file or stdin to stdout.
+
+    :param argv: the arguments, if None, sys.argv[1:]
+    :type argv: list of str or NoneType
+    :returns: 0 on success, 1 if any line could not be formatted
+    :rtype: int
+
+    Each output line corresponds to the input line in the same position.
+    A line that can not be formatted is reported on stderr and an empty
+    line is written in its place.
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+
+    texts = dict(
+       (name, getattr(args, name)) for name in field_labels() \
+          if getattr(args, name) is not None
+    )
+    try:
+        Formatter(parse_options(texts))
+    except (GUIValueError, justbytes.RangeError) as err:
+        parser.error(str(err))
+
+    infile = sys.stdin if args.input == "-" else open(args.input)
+    status = 0
+    try:
+        results = format_lines(
+           infile,
+           texts,
+           jobs=args.jobs or None,
+           chunk_size=args.chunk_size
+        )
+        for (number, (result, error)) in enumerate(results, 1):
+            if error is not None:
+                sys.stderr.write("line %d: %s\n" % (number, error))
+                status = 1
+            sys.stdout.write("%s\n" % ("" if result is None else result))
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+
+    return status
@@ -0,0 +1,251 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Formatting many numbers of bytes at once.
+
+If NumPy is installed and the numbers are in an integer array, the unit
+selection, scaling and rounding are done by array operations, wherever the
+arithmetic fits exactly in 64 bits. All other numbers are formatted one at
+a time by a compiled formatter.
+"""
+# pylint cannot infer the members of NumPy's compiled modules.
+# pylint: disable=no-member
+# pylint: disable=unsupported-assignment-operation
+import justbytes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ._compiled import compile_formatter
+
+from ._digits import REVERSED_METHODS
+
+from ._engine import CONFIG_CACHE
+from ._engine import default_options
+
+from ._units import unit_index
+
+
+# Any unsigned 64 bit value is less than this.
+_LIMIT = 2 ** 64
+
+
+def _units(value_config):
+    """
+    The units that may be chosen for a value, in increasing order.
+
+    :param ValueConfig value_config: the value configuration
+    :returns: the units, and the smallest magnitude for each unit but the first
+    :rtype: tuple of (list of unit) * (list of int)
+    """
+    if value_config.unit is not None:
+        return ([value_config.unit], [])
+
+    index = unit_index(value_config.binary_units, value_config.min_value)
+    return (
+       index.units,
+       [min(t, _LIMIT - 1) for t in index.integer_thresholds]
+    )
+
+
+def _increments(remainder, divisor, method):
+    """
+    Whether to round up, for each remainder.
+
+    :param remainder: the remainders, not all 0
+    :type remainder: numpy array of uint64
+    :param int divisor: the divisor
+    :param method: the rounding method
+    :rtype: numpy array of bool
+    """
+    if method in (justbytes.ROUND_DOWN, justbytes.ROUND_TO_ZERO):
+        return numpy.zeros(remainder.shape, dtype=bool)
+    if method is justbytes.ROUND_UP:
+        return numpy.ones(remainder.shape, dtype=bool)
+
+    # Compare remainder with divisor - remainder, rather than twice the
+    # remainder with the divisor, which might overflow.
+    other = numpy.uint64(divisor) - remainder
+    increments = remainder > other
+    if method is justbytes.ROUND_HALF_UP:
+        increments |= remainder == other
+    return increments
+
+
+def _scale_group(magnitudes, negative, factor, scale, method):
+    """
+    Scale and round magnitudes in one unit.
+
+    :param magnitudes: the magnitudes, in bytes
+    :type magnitudes: numpy array of uint64
+    :param negative: which values are negative
+    :type negative: numpy array of bool
+    :param int factor: the factor of the unit
+    :param int scale: base ** max_places
+    :param method: the rounding method
+    :returns: the integral parts, the fractional parts, and the relations
+    :rtype: tuple of numpy array * numpy array * numpy array
+
+    factor * scale must be less than 2 ** 64.
+    """
+    # pylint: disable=too-many-arguments
+    (whole, rest) = numpy.divmod(magnitudes, numpy.uint64(factor))
+    (fraction, remainder) = \
+       numpy.divmod(rest * numpy.uint64(scale), numpy.uint64(factor))
+
+    increments = numpy.where(
+       negative,
+       _increments(remainder, factor, REVERSED_METHODS[method]),
+       _increments(remainder, factor, method)
+    )
+    increments &= remainder != 0
+
+    fraction = fraction + increments.astype(numpy.uint64)
+    carry = fraction == numpy.uint64(scale)
+    fraction[carry] = 0
+    whole = whole + carry.astype(numpy.uint64)
+
+    relations = numpy.where(increments, 1, -1)
+    relations[remainder == 0] = 0
+    relations[negative] *= -1
+    return (whole, fraction, relations)
+
+
+def _format_array(values, formatter):
+    """
+    Format an array of integers with array operations where possible.
+
+    :param values: the values
+    :type values: numpy array of signed or unsigned integers
+    :param CompiledFormatter formatter: the formatter
+    :rtype: list of str
+    """
+    # pylint: disable=too-many-locals
+    value_config = formatter.string_config.VALUE_CONFIG
+    values = values.ravel()
+
+    if values.dtype.kind == "u":
+        negative = numpy.zeros(values.shape, dtype=bool)
+        magnitudes = values.astype(numpy.uint64)
+    else:
+        values = values.astype(numpy.int64)
+        negative = values < 0
+        # -(v + 1) + 1 does not overflow, even for the least int64
+        magnitudes = numpy.where(
+           negative,
+           (-(values + 1)).astype(numpy.uint64) + numpy.uint64(1),
+           values.astype(numpy.uint64)
+        )
+
+    (units, thresholds) = _units(value_config)
+    indices = numpy.searchsorted(
+       numpy.array(thresholds, dtype=numpy.uint64),
+       magnitudes,
+       side="right"
+    )
+
+    scale = value_config.base ** value_config.max_places
+    results = [None] * len(values)
+    for (index, unit) in enumerate(units):
+        positions = numpy.flatnonzero(indices == index)
+        if positions.size == 0:
+            continue
+
+        factor = int(unit.factor)
+        if factor * scale >= _LIMIT:
+            for position in positions.tolist():
+                results[position] = \
+                   formatter(justbytes.Range(int(values[position])))
+            continue
+
+        (whole, fraction, relations) = _scale_group(
+           magnitudes[positions],
+           negative[positions],
+           factor,
+           scale,
+           value_config.rounding_method
+        )
+        unit_str = str(unit)
+        signs = numpy.where(negative[positions], -1, 1)
+        for (position, sign, whole_part, fraction_part, relation) in zip(
+           positions.tolist(),
+           signs.tolist(),
+           whole.tolist(),
+           fraction.tolist(),
+           relations.tolist()
+        ):
+            results[position] = formatter.assemble(
+               sign,
+               whole_part,
+               fraction_part,
+               relation,
+               unit_str
+            )
+    return results
+
+
+def _vectorizable(values, formatter):
+    """
+    Whether ``values`` may be formatted by array operations.
+
+    :param values: the values
+    :param CompiledFormatter formatter: the formatter
+    :rtype: bool
+    """
+    if numpy is None or not isinstance(values, numpy.ndarray) or \
+       values.dtype.kind not in "iu":
+        return False
+
+    value_config = formatter.string_config.VALUE_CONFIG
+    return formatter.assembles and \
+       value_config.max_places is not None and \
+       (value_config.unit is not None or not value_config.exact_value)
+
+
+def format_sizes(values, options=None, config_cache=None):
+    """
+    Format many numbers of bytes.
+
+    :param values: the numbers of bytes
+    :type values: NumPy array or iterable of int or Range
+    :param options: the options, if None, the defaults
+    :type options: Options or NoneType
+    :param config_cache: cache of string configurations
+    :type config_cache: ConfigCache or NoneType
+    :returns: the strings, in order, the same as those of Range.getString()
+    :rtype: list of str
+    :raises RangeError: if the options are not a valid configuration
+
+    ``options`` are as returned by the gadgets of a RangeFrame, or by
+    parse_options(). An object array, or an array of integers too large
+    for 64 bits, is formatted one value at a time.
+    """
+    options = default_options() if options is None else options
+    config_cache = CONFIG_CACHE if config_cache is None else config_cache
+    formatter = compile_formatter(config_cache.get(options))
+
+    if _vectorizable(values, formatter):
+        return _format_array(values, formatter)
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        values = values.ravel().tolist()
+
+    return [
+       formatter(v if isinstance(v, justbytes.Range) else justbytes.Range(v))
+       for v in values
+    ]
@@ -0,0 +1,111 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Bounded caches.
+"""
+import threading
+
+from collections import namedtuple
+from collections import OrderedDict
+
+from ._errors import GUIValueError
+
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "size", "maxsize"])
+
+
+class LRUCache(object):
+    """
+    A bounded cache which evicts the least recently used entry.
+
+    The cache may be shared between threads. A value is computed outside
+    the lock, so two threads that miss on the same key at the same time
+    may both compute it; the later result replaces the earlier.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Initializer.
+
+        :param int maxsize: the maximum number of entries, at least 1
+        :raises GUIValueError: if maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise GUIValueError("maxsize must be at least 1, is %s" % maxsize)
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, factory):
+        """
+        Get the value for ``key``, calling ``factory`` to make it if absent.
+
+        :param key: the key
+        :type key: any hashable object
+        :param factory: makes the value, called with no arguments
+        :type factory: callable
+        :returns: the value for ``key``
+
+        If ``factory`` raises an exception nothing is cached.
+        """
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries[key] = value
+                self.hits += 1
+                return value
+
+        value = factory()
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Get the statistics for this cache.
+
+        :returns: hits, misses, current size and maximum size
+        :rtype: CacheStats
+        """
+        return CacheStats(
+           hits=self.hits,
+           misses=self.misses,
+           size=len(self._entries),
+           maxsize=self.maxsize
+        )
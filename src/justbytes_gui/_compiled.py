@@ -0,0 +1,223 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Formatters specialized for a fixed configuration.
+
+When the unit is fixed, a value is formatted with the same arithmetic for
+every value, so the divisors, digit conversion, and decorations may all be
+worked out once, when the formatter is compiled. The results are the same
+as those of Range.getString().
+"""
+import string
+
+from ._digits import REVERSED_METHODS
+from ._digits import exact_places
+from ._digits import int_digits
+from ._digits import round_quotient
+from ._digits import string_info
+
+
+_LOWER_DIGITS = string.digits + string.ascii_lowercase
+_UPPER_DIGITS = string.digits + string.ascii_uppercase
+
+# The %-format for a base that Python converts directly.
+_FORMATS = {8: "%o", 10: "%d", 16: "%x"}
+
+
+def _digit_function(base, digits_config):
+    """
+    Make a function converting an int to a string of digits, if simple.
+
+    :param int base: the base
+    :param DigitsConfig digits_config: how to show digits
+    :returns: the function, or None if the digits need separators
+    :rtype: callable or NoneType
+
+    Like justbases, the function returns "" for 0.
+    """
+    if base > 10 and not digits_config.use_letters:
+        return None
+
+    if base == 2:
+        return lambda n: bin(n)[2:] if n else ""
+
+    if base in _FORMATS:
+        fmt = _FORMATS[base]
+        if base == 16 and digits_config.use_caps:
+            fmt = "%X"
+        return lambda n: fmt % n if n else ""
+
+    table = _UPPER_DIGITS if digits_config.use_caps else _LOWER_DIGITS
+    return lambda n: "".join(table[d] for d in int_digits(n, base))
+
+
+class CompiledFormatter(object):
+    """
+    Formats Range values according to a fixed string configuration.
+
+    The formatter is specialized if the unit is fixed, the base is 10 or a
+    power of two, a digit is a single character, and, if max_places is
+    None, every value in the unit has a finite representation in the base.
+    Otherwise, and for non-integral values when max_places is None, it
+    formats a value in the usual way.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, string_config):
+        """
+        Initializer.
+
+        :param StringConfig string_config: the string configuration
+        """
+        self.string_config = string_config
+        value_config = string_config.VALUE_CONFIG
+        display_config = string_config.DISPLAY_CONFIG
+
+        base = value_config.base
+        self._digits = _digit_function(base, display_config.digits_config)
+
+        unit = value_config.unit
+        self._places = value_config.max_places
+        if unit is not None and self._places is None:
+            self._places = exact_places(
+               int(unit.factor),
+               base,
+               int(unit.factor).bit_length()
+            )
+            self._exact = True
+        else:
+            self._exact = False
+
+        self._method = value_config.rounding_method
+
+        strip_config = display_config.strip_config
+        (self._strip, self._strip_exact, self._strip_whole) = (
+           strip_config.strip,
+           strip_config.strip_exact,
+           strip_config.strip_whole
+        )
+        self._show_approx = display_config.show_approx_str
+
+        base_config = display_config.base_config
+        self._prefix = \
+           {8: "0", 16: "0x"}.get(base, "") if base_config.use_prefix else ""
+        self._subscript = \
+           "_%s" % base if base_config.use_subscript else ""
+
+        self.assembles = self._digits is not None and self._places is not None
+        self.specialized = \
+           unit is not None and \
+           (base == 10 or base & (base - 1) == 0) and \
+           self.assembles
+        if self.specialized:
+            self._factor = int(unit.factor)
+            self._scale = base ** self._places
+            self._unit = str(unit)
+
+    def _generic(self, value):
+        """
+        Format ``value`` in the usual way.
+
+        :param Range value: the value
+        :rtype: str
+        """
+        (result, relation, unit) = \
+           string_info(value, self.string_config.VALUE_CONFIG)
+        number = self.string_config.DISPLAY_IMPL.xform(result, relation)
+        return "%s %s" % (number, unit)
+
+    def __call__(self, value):
+        """
+        Format ``value``.
+
+        :param Range value: the value
+        :returns: the same string as value.getString(string_config)
+        :rtype: str
+        """
+        if not self.specialized:
+            return self._generic(value)
+
+        magnitude = value.magnitude
+        numerator = magnitude.numerator
+        denominator = magnitude.denominator * self._factor
+        sign = -1 if numerator < 0 else 1
+        numerator = abs(numerator)
+
+        if self._exact:
+            if magnitude.denominator != 1:
+                return self._generic(value)
+            scaled = numerator * self._scale // denominator
+            relation = 0
+        else:
+            (scaled, remainder) = \
+               divmod(numerator * self._scale, denominator)
+            method = self._method if sign == 1 else \
+               REVERSED_METHODS[self._method]
+            (scaled, relation) = \
+               round_quotient(scaled, remainder, denominator, method)
+            relation *= sign
+
+        (whole, fraction) = divmod(scaled, self._scale)
+        return self.assemble(sign, whole, fraction, relation, self._unit)
+
+    def assemble(self, sign, whole, fraction, relation, unit):
+        """
+        Make the string for a value that has been scaled and rounded.
+
+        :param int sign: the sign of the value, -1 or 1
+        :param int whole: the magnitude of the integral part, in the unit
+        :param int fraction: the fractional part, times base ** max_places
+        :param int relation: the relation of the result to the value
+        :param str unit: the unit
+        :returns: the string
+        :rtype: str
+
+        Only available if ``assembles`` is True, that is, if the digits
+        are single characters and the number of places is known; the unit
+        need not be fixed.
+        """
+        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-boolean-expressions
+        right = self._digits(fraction).zfill(self._places) \
+           if self._places else ""
+        if self._exact or self._strip or \
+           (relation == 0 and self._strip_exact) or \
+           (relation == 0 and self._strip_whole and fraction == 0):
+            right = right.rstrip("0")
+
+        number = "%s%s%s%s%s" % (
+           "-" if sign == -1 and (whole != 0 or fraction != 0) else "",
+           self._prefix,
+           self._digits(whole) or "0",
+           "." + right if right else "",
+           self._subscript
+        )
+
+        if self._show_approx and relation != 0:
+            number = "%s %s" % (">" if relation == -1 else "<", number)
+
+        return "%s %s" % (number, unit)
+
+
+def compile_formatter(string_config):
+    """
+    Compile a formatter for ``string_config``.
+
+    :param StringConfig string_config: the string configuration
+    :returns: a formatter, specialized if possible
+    :rtype: CompiledFormatter
+    """
+    return CompiledFormatter(string_config)
@@ -16,15 +16,58 @@
 """
 Highest level code for module.
 """
-import decimal
-
-import justbytes
-
 from justoptions_gui import Config
 from justoptions_gui import ChoiceSelector
 from justoptions_gui import JustSelector
 from justoptions_gui import MaybeSelector
 
+from ._fields import CONFIGS
+from ._fields import ChoiceField
+from ._fields import FIELDS
+from ._fields import MaybeField
+
+
+def _selector(field):
+    """
+    Make the selector for ``field``.
+
+    :param field: the field
+    :type field: JustField or MaybeField or ChoiceField
+    :rtype: WidgetSelector
+    """
+    if isinstance(field, MaybeField):
+        return MaybeSelector(_selector(field.field))
+    if isinstance(field, ChoiceField):
+        return ChoiceSelector(field.choices)
+    return JustSelector(field.python_type)
+
+
+class _FieldMap(object):
+    """
+    The _FIELD_MAP of a Config gadget, made when a gadget is first built.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, fields):
+        """
+        Initializer.
+
+        :param fields: map from name to label and field
+        :type fields: dict of str * (tuple of str * field)
+        """
+        self._fields = fields
+        self._field_map = None
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self._field_map is None:
+            self._field_map = dict(
+               (name, (label, _selector(field))) for \
+                  (name, (label, field)) in self._fields.items()
+            )
+        return self._field_map
+
 
 class BaseConfig(Config):
     """
@@ -32,12 +75,9 @@ class BaseConfig(Config):
     """
     # pylint: disable=too-few-public-methods
 
-    CONFIG = justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG.base_config
+    CONFIG = CONFIGS.base
 
-    _FIELD_MAP = {
-       "use_prefix": ("Display base prefix?", JustSelector(bool)),
-       "use_subscript": ("Display base subscript?", JustSelector(bool))
-    }
+    _FIELD_MAP = _FieldMap(FIELDS.base)
 
 
 class StripConfig(Config):
@@ -46,17 +86,9 @@ class StripConfig(Config):
     """
     # pylint: disable=too-few-public-methods
 
-    CONFIG = justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG.strip_config
+    CONFIG = CONFIGS.strip
 
-    _FIELD_MAP = {
-       "strip": ("Strip all trailing zeros?", JustSelector(bool)),
-       "strip_exact": ("Strip trailing zeros if exact?", JustSelector(bool)),
-       "strip_whole":
-          (
-             "Strip trailing zeros if exact whole number?",
-             JustSelector(bool)
-          )
-    }
+    _FIELD_MAP = _FieldMap(FIELDS.strip)
 
 
 class DigitsConfig(Config):
@@ -65,13 +97,9 @@ class DigitsConfig(Config):
     """
     # pylint: disable=too-few-public-methods
 
-    CONFIG = justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG.digits_config
+    CONFIG = CONFIGS.digits
 
-    _FIELD_MAP = {
-       "separator": ("Separator:", JustSelector(str)),
-       "use_caps": ("Use capital letters?", JustSelector(bool)),
-       "use_letters": ("Use letters for digits?", JustSelector(bool))
-    }
+    _FIELD_MAP = _FieldMap(FIELDS.digits)
 
 
 class MiscDisplayConfig(Config):
@@ -80,12 +108,9 @@ class MiscDisplayConfig(Config):
     """
     # pylint: disable=too-few-public-methods
 
-    CONFIG = justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG
+    CONFIG = CONFIGS.misc
 
-    _FIELD_MAP = {
-       "show_approx_str":
-          ("Indicate if value is approximate?", JustSelector(bool))
-    }
+    _FIELD_MAP = _FieldMap(FIELDS.misc)
 
 
 class ValueConfig(Config):
@@ -94,41 +119,6 @@ class ValueConfig(Config):
     """
     # pylint: disable=too-few-public-methods
 
-    CONFIG = justbytes.Config.STRING_CONFIG.VALUE_CONFIG
-
-    _FIELD_MAP = {
-       "base": ("Base:", JustSelector(int)),
-       "binary_units": ("Use IEC units?", JustSelector(bool)),
-       "exact_value": ("Get exact value?", JustSelector(bool)),
-       "max_places":
-          (
-             "Maximum number of digits right of radix:",
-             MaybeSelector(JustSelector(int))
-          ),
-       "min_value":
-          (
-             "Bounding factor for non-fractional part:",
-              JustSelector(decimal.Decimal)
-          ),
-       "rounding_method":
-          (
-             "Rounding method:",
-             ChoiceSelector([
-                (justbytes.ROUND_DOWN, "down"),
-                (justbytes.ROUND_HALF_DOWN, "half down"),
-                (justbytes.ROUND_HALF_UP, "half up"),
-                (justbytes.ROUND_HALF_ZERO, "half 0"),
-                (justbytes.ROUND_TO_ZERO, "to 0"),
-                (justbytes.ROUND_UP, "up")
-             ])
-          ),
-       "unit":
-          (
-             "Unit:",
-             MaybeSelector(
-                ChoiceSelector(
-                   [(u, str(u)) for u in justbytes.UNITS()]
-                )
-             )
-          )
-    }
+    CONFIG = CONFIGS.value
+
+    _FIELD_MAP = _FieldMap(FIELDS.value)
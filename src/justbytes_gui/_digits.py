@@ -0,0 +1,272 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Fast digit generation for the value stage of rendering.
+
+justbases converts a value to a base one digit at a time, which takes time
+quadratic in the number of digits. Here, when the number of places is
+bounded, the value is scaled and rounded as a single integer, or, if its
+fractional part ends within the bound, scaled just enough to be exact. The
+integer is converted by splitting it in halves by precomputed powers of the base, or,
+for a power of two, by slicing its binary representation.
+
+The results are the same as those of justbases: equal Radix objects and
+relations.
+"""
+try:
+    from math import gcd
+except ImportError:
+    from fractions import gcd # pylint: disable=ungrouped-imports
+
+import justbases
+import justbytes
+
+from ._units import unit_index
+
+
+# The largest number of digits converted one at a time.
+_LEAF_DIGITS = 16
+
+# Maps a base to [base, base ** 2, base ** 4, ...], extended as needed.
+_POWERS = dict()
+
+# The method to use on the magnitude of a negative value.
+REVERSED_METHODS = {
+   justbytes.ROUND_DOWN: justbytes.ROUND_UP,
+   justbytes.ROUND_UP: justbytes.ROUND_DOWN,
+   justbytes.ROUND_HALF_DOWN: justbytes.ROUND_HALF_UP,
+   justbytes.ROUND_HALF_UP: justbytes.ROUND_HALF_DOWN,
+   justbytes.ROUND_HALF_ZERO: justbytes.ROUND_HALF_ZERO,
+   justbytes.ROUND_TO_ZERO: justbytes.ROUND_TO_ZERO
+}
+
+
+def _powers(base, value):
+    """
+    The powers base ** (2 ** k) up to the first whose square exceeds value.
+
+    :param int base: the base
+    :param int value: the value to be converted
+    :rtype: list of int
+    """
+    powers = _POWERS.get(base, [base])
+    if powers[-1] * powers[-1] <= value:
+        powers = list(powers)
+        while powers[-1] * powers[-1] <= value:
+            powers.append(powers[-1] * powers[-1])
+        _POWERS[base] = powers
+    return powers
+
+
+def _leaf_digits(value, base, width):
+    """
+    Convert a small value one digit at a time.
+
+    :param int value: the value
+    :param int base: the base
+    :param width: the number of digits, padded with zeros, or None
+    :type width: int or NoneType
+    :rtype: list of int
+    """
+    digits = []
+    while value != 0:
+        (value, digit) = divmod(value, base)
+        digits.append(int(digit))
+    if width is not None:
+        digits.extend([0] * (width - len(digits)))
+    digits.reverse()
+    return digits
+
+
+def _split_digits(value, base, powers, level, width, digits):
+    """
+    Convert ``value`` by dividing it by powers[level] and converting halves.
+
+    :param int value: the value, less than powers[level] ** 2
+    :param int base: the base
+    :param powers: the powers of the base, as made by _powers()
+    :type powers: list of int
+    :param int level: the index of the power to divide by
+    :param width: the number of digits, padded with zeros, or None
+    :type width: int or NoneType
+    :param digits: the digits so far, extended by side effect
+    :type digits: list of int
+    """
+    # pylint: disable=too-many-arguments
+    half = 1 << level
+    if 2 * half <= _LEAF_DIGITS:
+        digits.extend(_leaf_digits(value, base, width))
+        return
+
+    (high, low) = divmod(value, powers[level])
+    if high != 0 or width is not None:
+        _split_digits(
+           high,
+           base,
+           powers,
+           level - 1,
+           None if width is None else width - half,
+           digits
+        )
+        _split_digits(low, base, powers, level - 1, half, digits)
+    else:
+        _split_digits(low, base, powers, level - 1, None, digits)
+
+
+def int_digits(value, base):
+    """
+    The digits of ``value`` in ``base``, most significant first.
+
+    :param int value: the value, at least 0
+    :param int base: the base, at least 2
+    :returns: the digits, [] for 0, as Nats.convert_from_int()
+    :rtype: list of int
+    """
+    if value == 0:
+        return []
+
+    if base & (base - 1) == 0:
+        bits = base.bit_length() - 1
+        binary = bin(value)[2:]
+        binary = "0" * (-len(binary) % bits) + binary
+        return [int(binary[i:i + bits], 2) for i in range(0, len(binary), bits)]
+
+    powers = _powers(base, value)
+    digits = []
+    _split_digits(value, base, powers, len(powers) - 1, None, digits)
+    return digits
+
+
+def exact_places(denominator, base, precision):
+    """
+    The number of places needed to show 1 / ``denominator`` exactly.
+
+    :param int denominator: the denominator, at least 1
+    :param int base: the base
+    :param int precision: the most places to look for
+    :returns: the number of places, or None if more than precision
+    :rtype: int or NoneType
+
+    Each step removes the factors that the denominator shares with the
+    base; the number of steps is the number of places.
+    """
+    places = 0
+    while denominator != 1:
+        if places == precision:
+            return None
+        common = gcd(denominator, base)
+        if common == 1:
+            return None
+        denominator //= common
+        places += 1
+    return places
+
+
+def round_quotient(quotient, remainder, divisor, method):
+    """
+    Round a quotient of non-negative numbers.
+
+    :param int quotient: the quotient, rounded down
+    :param int remainder: the remainder, less than divisor
+    :param int divisor: the divisor
+    :param method: the rounding method
+    :returns: the rounded quotient and its relation to the exact quotient
+    :rtype: tuple of int * int
+    """
+    if remainder == 0:
+        return (quotient, 0)
+
+    if method in (justbytes.ROUND_DOWN, justbytes.ROUND_TO_ZERO):
+        return (quotient, -1)
+    if method is justbytes.ROUND_UP:
+        return (quotient + 1, 1)
+
+    twice = 2 * remainder
+    if twice < divisor:
+        return (quotient, -1)
+    if twice > divisor or method is justbytes.ROUND_HALF_UP:
+        return (quotient + 1, 1)
+    return (quotient, -1)
+
+
+def from_rational(value, base, precision, method):
+    """
+    Convert ``value`` to ``base`` as Radices.from_rational() does.
+
+    :param Rational value: the value
+    :param int base: the base, at least 2
+    :param precision: the number of places, or None for all
+    :type precision: int or NoneType
+    :param method: the rounding method
+    :returns: the result and its relation to ``value``
+    :rtype: tuple of Radix * int
+
+    If precision is None, or value is 0, justbases does the conversion,
+    since it must find any repeating part of the result.
+    """
+    if precision is None or value == 0:
+        return justbases.Radices.from_rational(value, base, precision, method)
+
+    value = Fraction(value)
+    sign = -1 if value < 0 else 1
+    if sign == -1:
+        method = REVERSED_METHODS[method]
+    value = abs(value)
+
+    places = exact_places(value.denominator, base, precision)
+    if places is None:
+        (scaled, remainder) = \
+           divmod(value.numerator * base ** precision, value.denominator)
+        (scaled, relation) = \
+           round_quotient(scaled, remainder, value.denominator, method)
+        digits = int_digits(scaled, base)
+    else:
+        scaled = value.numerator * base ** places // value.denominator
+        relation = 0
+        digits = int_digits(scaled, base) + [0] * (precision - places)
+
+    digits = [0] * (precision - len(digits)) + digits
+    split = len(digits) - precision
+
+    result = justbases.Radix(
+       sign,
+       digits[:split],
+       digits[split:],
+       [],
+       base,
+       validate=False
+    )
+    return (result, relation * sign)
+
+
+def string_info(value, config):
+    """
+    The value stage of rendering, as Range.getStringInfo().
+
+    :param Range value: the value
+    :param ValueConfig config: the value configuration
+    :returns: the digits, their relation to the value, and the unit
+    :rtype: tuple of Radix * int * unit
+    """
+    index = unit_index(config.binary_units, config.min_value)
+    (magnitude, unit) = index.components(value, config)
+    (result, relation) = from_rational(
+       magnitude,
+       config.base,
+       config.max_places,
+       config.rounding_method
+    )
+    return (result, relation, unit)
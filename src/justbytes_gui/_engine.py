@@ -0,0 +1,481 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Turning option values into justbytes configurations, without any GUI.
+"""
+import decimal
+
+from fractions import Fraction
+
+import justbytes
+
+from ._cache import LRUCache
+
+from ._compiled import compile_formatter
+
+from ._digits import string_info
+
+from ._errors import GUIValueError
+
+from ._fields import CONFIGS
+from ._fields import ChoiceField
+from ._fields import FIELDS
+from ._fields import MaybeField
+from ._fields import Options
+
+
+_TRUE_STRS = ("1", "on", "true", "yes")
+_FALSE_STRS = ("0", "false", "no", "off")
+
+
+def default_options():
+    """
+    The options which the gadgets show when first constructed.
+
+    :rtype: Options
+    """
+    return Options(
+       *(
+          dict((k, getattr(config, k)) for k in fields)
+          for (config, fields) in zip(CONFIGS, FIELDS)
+       )
+    )
+
+
+def _parse_text(field, text):
+    """
+    Convert ``text`` to a value as the gadget for ``field`` would.
+
+    :param field: the field
+    :type field: JustField or MaybeField or ChoiceField
+    :param str text: the text
+    :returns: the value
+    :raises GUIValueError: if the text can not be converted
+    """
+    if isinstance(field, MaybeField):
+        if text.lower() == "none":
+            return None
+        return _parse_text(field.field, text)
+
+    if isinstance(field, ChoiceField):
+        for (choice, name) in field.choices:
+            if name == text:
+                return choice
+        raise GUIValueError(
+           "\"%s\" is not one of %s" %
+           (text, ", ".join(name for (_, name) in field.choices))
+        )
+
+    if field.python_type is bool:
+        if text.lower() in _TRUE_STRS:
+            return True
+        if text.lower() in _FALSE_STRS:
+            return False
+        raise GUIValueError("\"%s\" is not a boolean value" % text)
+
+    try:
+        return field.python_type(text)
+    except (ValueError, decimal.InvalidOperation):
+        raise GUIValueError(
+           "\"%s\" could not be converted to %s" %
+           (text, field.python_type.__name__)
+        )
+
+
+def _format_text(field, value):
+    """
+    Convert ``value`` to text that _parse_text() converts back to it.
+
+    :param field: the field
+    :type field: JustField or MaybeField or ChoiceField
+    :param object value: the value
+    :rtype: str
+    """
+    if isinstance(field, MaybeField):
+        if value is None:
+            return "none"
+        return _format_text(field.field, value)
+
+    if isinstance(field, ChoiceField):
+        return next(name for (choice, name) in field.choices \
+           if choice is value)
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    return str(value)
+
+
+def field_labels():
+    """
+    The label of every option field.
+
+    :returns: a map from field name to label
+    :rtype: dict of str * str
+    """
+    return dict(
+       (name, label) for fields in FIELDS \
+          for (name, (label, _)) in fields.items()
+    )
+
+
+def _find_field(name):
+    """
+    Find the section and the description of the field ``name``.
+
+    :param str name: the name of the field
+    :returns: the index of the section in Options and the field
+    :rtype: tuple of int * (JustField or MaybeField or ChoiceField)
+    :raises GUIValueError: if there is no such field
+    """
+    for (index, fields) in enumerate(FIELDS):
+        if name in fields:
+            return (index, fields[name][1])
+    raise GUIValueError("\"%s\" is not an option" % name)
+
+
+def _choice_texts(field):
+    """
+    All the texts that a field with a finite set of values accepts.
+
+    :param field: the field
+    :type field: JustField or MaybeField or ChoiceField
+    :returns: the texts or None if the values are not enumerable
+    :rtype: list of str or NoneType
+    """
+    if isinstance(field, MaybeField):
+        texts = _choice_texts(field.field)
+        return None if texts is None else ["none"] + texts
+
+    if isinstance(field, ChoiceField):
+        return [name for (_, name) in field.choices]
+
+    if field.python_type is bool:
+        return ["false", "true"]
+
+    return None
+
+
+def field_choices(name):
+    """
+    All the textual values of the field ``name``, if there are few.
+
+    :param str name: the name of the field
+    :returns: the texts or None if the field takes, e.g., any int
+    :rtype: list of str or NoneType
+    :raises GUIValueError: if there is no such field
+    """
+    return _choice_texts(_find_field(name)[1])
+
+
+def parse_options(texts, options=None):
+    """
+    Get options from textual values for some fields.
+
+    :param texts: map from field name to text
+    :type texts: dict of str * str
+    :param options: the options to update, if None, the defaults
+    :type options: Options or NoneType
+    :returns: the options with the fields in ``texts`` changed
+    :rtype: Options
+    :raises GUIValueError: if a field is unknown or a text is bad
+    """
+    options = default_options() if options is None else options
+    sections = [dict(section) for section in options]
+    for (name, text) in texts.items():
+        (index, field) = _find_field(name)
+        sections[index][name] = _parse_text(field, text)
+    return Options(*sections)
+
+
+def format_options(options):
+    """
+    Get textual values for every field of ``options``.
+
+    :param Options options: the options
+    :returns: map from field name to text, usable by parse_options()
+    :rtype: dict of str * str
+
+    Unlike options, the result may be pickled and sent to another process.
+    """
+    return dict(
+       (name, _format_text(fields[name][1], value)) \
+          for (section, fields) in zip(options, FIELDS) \
+          for (name, value) in section.items()
+    )
+
+
+def _freeze_section(section):
+    """
+    Get a hashable snapshot of one section of the options.
+
+    :param section: the keyword arguments of the section
+    :type section: dict of str * object
+    :rtype: tuple
+    """
+    return tuple(sorted(section.items()))
+
+
+def freeze(options):
+    """
+    Get a hashable snapshot of ``options``.
+
+    :param Options options: the options
+    :returns: a snapshot which is equal for equal options
+    :rtype: tuple
+    """
+    return tuple(_freeze_section(section) for section in options)
+
+
+def make_value_config(value):
+    """
+    Construct a value configuration from the value section of the options.
+
+    :param value: the keyword arguments for the value configuration
+    :type value: dict of str * object
+    :returns: the value configuration
+    :rtype: justbytes.ValueConfig
+    :raises RangeError: if the configuration is invalid
+
+    A Decimal min_value, as entered in the GUI, is converted to the exact
+    equivalent Fraction, which every version of justbytes accepts.
+    """
+    value = dict(value)
+    if isinstance(value.get("min_value"), decimal.Decimal):
+        value["min_value"] = Fraction(value["min_value"])
+    return justbytes.ValueConfig(**value)
+
+
+def make_string_config(options, value_config=None):
+    """
+    Construct a string configuration from ``options``.
+
+    :param Options options: the options
+    :param value_config: the value configuration to use, if already made
+    :type value_config: justbytes.ValueConfig or NoneType
+    :returns: the string configuration
+    :rtype: justbytes.StringConfig
+    :raises RangeError: if the configuration is invalid
+    """
+    if value_config is None:
+        value_config = make_value_config(options.value)
+
+    base_config = justbytes.BaseConfig(**options.base)
+    digits_config = justbytes.DigitsConfig(**options.digits)
+    strip_config = justbytes.StripConfig(**options.strip)
+    display_config = justbytes.DisplayConfig(
+       base_config=base_config,
+       digits_config=digits_config,
+       strip_config=strip_config,
+       **options.misc
+    )
+    return justbytes.StringConfig(
+       value_config,
+       display_config,
+       justbytes.Config.STRING_CONFIG.DISPLAY_IMPL_CLASS
+    )
+
+
+def display(info, string_config):
+    """
+    The display stage of rendering: make a string from computed digits.
+
+    :param info: the result of string_info() or Range.getStringInfo()
+    :type info: tuple of Radix * int * unit
+    :param StringConfig string_config: the string configuration
+    :returns: the same string as Range.getString()
+    :rtype: str
+    """
+    (result, relation, unit) = info
+    number = string_config.DISPLAY_IMPL.xform(result, relation)
+    return "%s %s" % (number, unit)
+
+
+class ConfigCache(object):
+    """
+    Cache of string configurations, keyed on the options that made them.
+
+    Equal options always yield the same StringConfig object while it
+    remains in the cache. Options with equal value sections share the same
+    ValueConfig object, so that the value stage of rendering can be cached
+    independently of the display options.
+    """
+
+    def __init__(self, maxsize=64):
+        """
+        Initializer.
+
+        :param int maxsize: the maximum number of configurations to keep
+        """
+        self.CACHE = LRUCache(maxsize)
+        self.VALUE_CACHE = LRUCache(maxsize)
+
+    def get_value_config(self, value):
+        """
+        Get the value configuration for the value section of the options.
+
+        :param value: the keyword arguments for the value configuration
+        :type value: dict of str * object
+        :rtype: justbytes.ValueConfig
+        :raises RangeError: if the configuration is invalid
+        """
+        return self.VALUE_CACHE.get(
+           _freeze_section(value),
+           lambda: make_value_config(value)
+        )
+
+    def get(self, options):
+        """
+        Get the string configuration for ``options``.
+
+        :param Options options: the options
+        :returns: the string configuration
+        :rtype: justbytes.StringConfig
+        :raises RangeError: if the configuration is invalid
+        """
+        return self.CACHE.get(
+           freeze(options),
+           lambda: make_string_config(
+              options,
+              self.get_value_config(options.value)
+           )
+        )
+
+    def stats(self):
+        """
+        Get the statistics for this cache.
+
+        :rtype: CacheStats
+        """
+        return self.CACHE.stats()
+
+
+class RenderCache(object):
+    """
+    Cache of rendered strings, in two stages.
+
+    The value stage, which chooses the unit and computes the digits and
+    their relation to the exact value, is keyed on magnitude and value
+    configuration. The display stage, which turns those into a string, is
+    keyed on magnitude and string configuration. Changing only display
+    options therefore reuses the value stage.
+
+    Configurations are compared by identity, so configurations obtained
+    from a ConfigCache share entries whenever their options are equal.
+    """
+
+    def __init__(self, maxsize=4096, value_maxsize=4096):
+        """
+        Initializer.
+
+        :param int maxsize: the maximum number of strings to keep
+        :param int value_maxsize: the maximum number of value stage results
+        """
+        self.CACHE = LRUCache(maxsize)
+        self.VALUE_CACHE = LRUCache(value_maxsize)
+
+    def info(self, value, value_config):
+        """
+        Get the value stage result for ``value``.
+
+        :param Range value: the value to render
+        :param ValueConfig value_config: the value configuration
+        :returns: the same result as value.getStringInfo(value_config)
+        :rtype: tuple of Radix * int * unit
+        :raises RangeError: if the value can not be rendered
+        """
+        return self.VALUE_CACHE.get(
+           (value.magnitude, value_config),
+           lambda: string_info(value, value_config)
+        )
+
+    def render(self, value, string_config):
+        """
+        Get the string for ``value`` according to ``string_config``.
+
+        :param Range value: the value to render
+        :param StringConfig string_config: the string configuration
+        :returns: the string representation of ``value``
+        :rtype: str
+        :raises RangeError: if the value can not be rendered
+        """
+        return self.CACHE.get(
+           (value.magnitude, string_config),
+           lambda: display(
+              self.info(value, string_config.VALUE_CONFIG),
+              string_config
+           )
+        )
+
+    def stats(self):
+        """
+        Get the statistics for the display stage.
+
+        :rtype: CacheStats
+        """
+        return self.CACHE.stats()
+
+    def value_stats(self):
+        """
+        Get the statistics for the value stage.
+
+        :rtype: CacheStats
+        """
+        return self.VALUE_CACHE.stats()
+
+
+CONFIG_CACHE = ConfigCache()
+RENDER_CACHE = RenderCache()
+
+
+class Formatter(object):
+    """
+    Formats Range values according to a single set of options.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, options, config_cache=None, render_cache=None):
+        """
+        Initializer.
+
+        :param Options options: the options
+        :param config_cache: cache of string configurations
+        :type config_cache: ConfigCache or NoneType
+        :param render_cache: cache of rendered strings, if any
+        :type render_cache: RenderCache or NoneType
+        :raises RangeError: if the options are not a valid configuration
+
+        If config_cache is None, the shared cache is used. If render_cache
+        is None, nothing is cached, which suits values that rarely repeat,
+        and values are formatted by a compiled formatter.
+        """
+        config_cache = CONFIG_CACHE if config_cache is None else config_cache
+        self.string_config = config_cache.get(options)
+        self.render_cache = render_cache
+        self._compiled = compile_formatter(self.string_config)
+
+    def format(self, value):
+        """
+        Format ``value``.
+
+        :param Range value: the value
+        :returns: the string representation of ``value``
+        :rtype: str
+        :raises RangeError: if the value can not be rendered
+        """
+        if self.render_cache is None:
+            return self._compiled(value)
+        return self.render_cache.render(value, self.string_config)
@@ -0,0 +1,162 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+A window showing a value under every combination of some options.
+"""
+import Tkinter
+
+from ._errors import GUIValueError
+
+from ._matrix import MatrixRender
+from ._matrix import combinations
+from ._matrix import parse_axes
+
+
+class MatrixWindow(Tkinter.Toplevel):
+    """
+    Window to explore combinations of options for a single Range value.
+
+    The last axis runs across the columns, all other axes down the rows.
+    Cells are filled in as the results arrive.
+    """
+    # pylint: disable=too-many-ancestors
+    # pylint: disable=too-many-instance-attributes
+
+    POLL = 50
+
+    _DEFAULT_AXES = "rounding_method\nbinary_units\nbase: 2, 10, 16"
+
+    def __init__(self, master, value, options):
+        """
+        Initializer.
+
+        :param Tkinter.Widget master: the master
+        :param Range value: the value to display
+        :param Options options: the options that the axes modify
+        """
+        Tkinter.Toplevel.__init__(self, master)
+        self.wm_title("Justbytes Option Matrix")
+        self.value = value
+        self.options = options
+        self._render = None
+        self._poll_after = None
+        self._cells = dict()
+
+        controls = Tkinter.Frame(self)
+        controls.pack({"side": "top"})
+
+        Tkinter.Label(
+           controls,
+           text="Axes, one per line, as field: value, value, ..."
+        ).pack({"side": "top"})
+
+        self.AXES = Tkinter.Text(controls, height=5, width=48)
+        self.AXES.insert(Tkinter.END, self._DEFAULT_AXES)
+        self.AXES.pack({"side": "top"})
+
+        close_button = \
+           Tkinter.Button(controls, text="Close", command=self.destroy)
+        close_button.pack({"side": "right"})
+
+        render_button = \
+           Tkinter.Button(controls, text="Render", command=self.render)
+        render_button.pack({"side": "right"})
+
+        self.ERROR_STR = Tkinter.StringVar()
+        error = Tkinter.Label(self, textvariable=self.ERROR_STR, fg="red")
+        error.pack({"side": "top"})
+
+        self.GRID = Tkinter.Frame(self)
+        self.GRID.pack({"side": "top"})
+
+    def _make_grid(self, axes):
+        """
+        Make an empty grid for ``axes``.
+
+        :param axes: the axes
+        :type axes: list of tuple of str * (list of str)
+        """
+        self.GRID.destroy()
+        self.GRID = Tkinter.Frame(self)
+        self.GRID.pack({"side": "top"})
+        self._cells = dict()
+
+        row_indices = [index for (index, _) in combinations({}, axes[:-1])]
+
+        (column_name, column_values) = axes[-1]
+        Tkinter.Label(self.GRID, text=column_name).grid(row=0, column=0)
+        for (column, text) in enumerate(column_values, 1):
+            Tkinter.Label(self.GRID, text=text).grid(row=0, column=column)
+
+        for (row, row_index) in enumerate(row_indices, 1):
+            text = ", ".join(
+               "%s=%s" % (name, values[i]) for ((name, values), i) in \
+                  zip(axes[:-1], row_index)
+            )
+            Tkinter.Label(self.GRID, text=text).grid(row=row, column=0)
+            for column in range(len(column_values)):
+                cell = Tkinter.Label(self.GRID, text="...")
+                cell.grid(row=row, column=column + 1)
+                self._cells[row_index + (column,)] = cell
+
+    def render(self):
+        """
+        Render the value for every combination of the axes.
+        """
+        self._stop()
+
+        try:
+            axes = parse_axes(self.AXES.get("1.0", Tkinter.END))
+        except GUIValueError as err:
+            self.ERROR_STR.set(err)
+            return
+        self.ERROR_STR.set("")
+
+        self._make_grid(axes)
+        self._render = MatrixRender(self.value, self.options, axes)
+        self._render.start()
+        self._poll_after = self.after(self.POLL, self._poll)
+
+    def _stop(self):
+        """
+        Stop any rendering in progress.
+        """
+        if self._poll_after is not None:
+            self.after_cancel(self._poll_after)
+            self._poll_after = None
+        if self._render is not None:
+            self._render.cancel()
+            self._render = None
+
+    def _poll(self):
+        """
+        Fill in the cells for results that have arrived.
+        """
+        self._poll_after = None
+        for (index, result, error) in self._render.results():
+            if error is None:
+                self._cells[index].configure(text=result)
+            else:
+                self._cells[index].configure(text=error, fg="red")
+
+        if self._render.done:
+            self._render = None
+        else:
+            self._poll_after = self.after(self.POLL, self._poll)
+
+    def destroy(self):
+        self._stop()
+        Tkinter.Toplevel.destroy(self)
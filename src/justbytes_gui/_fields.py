@@ -0,0 +1,164 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+The option fields of each section of the configuration, without any GUI.
+
+The fields are described here, rather than by the selectors of
+justoptions_gui, so that they may be used without importing Tkinter.
+"""
+import decimal
+
+from collections import namedtuple
+
+import justbytes
+
+
+# The keyword arguments for each section of the configuration, as returned
+# by the get() method of the corresponding Config gadget.
+Options = namedtuple("Options", ["value", "base", "digits", "strip", "misc"])
+
+
+class JustField(object):
+    """
+    A field which takes any value of a Python type.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, python_type):
+        """
+        Initializer.
+
+        :param type python_type: the type of the value
+        """
+        self.python_type = python_type
+
+
+class MaybeField(object):
+    """
+    A field which takes None or a value of another field.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, field):
+        """
+        Initializer.
+
+        :param field: the field for values other than None
+        :type field: JustField or ChoiceField
+        """
+        self.field = field
+
+
+class ChoiceField(object):
+    """
+    A field which takes one of a list of values, each with a name.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, choices):
+        """
+        Initializer.
+
+        :param choices: the values and their names, or a function making them
+        :type choices: list of tuple of object * str or callable
+
+        A function is called only when the choices are first needed.
+        """
+        self._choices = choices
+
+    @property
+    def choices(self):
+        """
+        The values and their names.
+
+        :rtype: list of tuple of object * str
+        """
+        if callable(self._choices):
+            self._choices = self._choices()
+        return self._choices
+
+
+def _units():
+    """
+    The choices for the unit field.
+
+    :rtype: list of tuple of object * str
+    """
+    return [(u, str(u)) for u in justbytes.UNITS()]
+
+
+# The configuration which supplies the default values of each section.
+CONFIGS = Options(
+   value=justbytes.Config.STRING_CONFIG.VALUE_CONFIG,
+   base=justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG.base_config,
+   digits=justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG.digits_config,
+   strip=justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG.strip_config,
+   misc=justbytes.Config.STRING_CONFIG.DISPLAY_CONFIG
+)
+
+# A map from name to label and field for each section.
+FIELDS = Options(
+   value={
+      "base": ("Base:", JustField(int)),
+      "binary_units": ("Use IEC units?", JustField(bool)),
+      "exact_value": ("Get exact value?", JustField(bool)),
+      "max_places":
+         (
+            "Maximum number of digits right of radix:",
+            MaybeField(JustField(int))
+         ),
+      "min_value":
+         (
+            "Bounding factor for non-fractional part:",
+            JustField(decimal.Decimal)
+         ),
+      "rounding_method":
+         (
+            "Rounding method:",
+            ChoiceField([
+               (justbytes.ROUND_DOWN, "down"),
+               (justbytes.ROUND_HALF_DOWN, "half down"),
+               (justbytes.ROUND_HALF_UP, "half up"),
+               (justbytes.ROUND_HALF_ZERO, "half 0"),
+               (justbytes.ROUND_TO_ZERO, "to 0"),
+               (justbytes.ROUND_UP, "up")
+            ])
+         ),
+      "unit": ("Unit:", MaybeField(ChoiceField(_units)))
+   },
+   base={
+      "use_prefix": ("Display base prefix?", JustField(bool)),
+      "use_subscript": ("Display base subscript?", JustField(bool))
+   },
+   digits={
+      "separator": ("Separator:", JustField(str)),
+      "use_caps": ("Use capital letters?", JustField(bool)),
+      "use_letters": ("Use letters for digits?", JustField(bool))
+   },
+   strip={
+      "strip": ("Strip all trailing zeros?", JustField(bool)),
+      "strip_exact": ("Strip trailing zeros if exact?", JustField(bool)),
+      "strip_whole":
+         (
+            "Strip trailing zeros if exact whole number?",
+            JustField(bool)
+         )
+   },
+   misc={
+      "show_approx_str":
+         ("Indicate if value is approximate?", JustField(bool))
+   }
+)
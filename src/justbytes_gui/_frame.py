@@ -16,25 +16,62 @@
 """
 Highest level code for module.
 """
+import time
 import Tkinter
 
 import justbytes
 
+from justoptions_gui import GUIError
+
 from ._config import BaseConfig
 from ._config import DigitsConfig
 from ._config import MiscDisplayConfig
 from ._config import StripConfig
 from ._config import ValueConfig
 
+from ._compiled import compile_formatter
+
+from ._engine import CONFIG_CACHE
+from ._engine import RENDER_CACHE
+from ._engine import Options
+from ._engine import default_options
+from ._engine import freeze
+
 from ._errors import GUIValueError
 
+from ._explorer import MatrixWindow
+
+from ._metrics import LatencyStats
+from ._metrics import Stopwatch
+
+from ._table import RangeTable
+
+from ._worker import RenderWorker
+
+
+# The errors raised when the gadgets do not specify a usable configuration.
+_CONFIG_ERRORS = (GUIError, GUIValueError, justbytes.RangeError)
+
 
 class RangeFrame(Tkinter.Frame):
     """
     Simple class to display a single Range value.
+
+    In live mode, the value is rendered again whenever the options have
+    stayed unchanged for LIVE_DEBOUNCE seconds. The render runs in a worker
+    thread; the frame checks for its result every LIVE_POLL milliseconds.
+
+    The option gadgets are not built until the Options checkbutton is first
+    selected; until then, the default options are used.
+
+    The time taken by each phase of show() is recorded in ``stats``, and
+    summarized in a status bar if the Stats checkbutton is selected.
     """
     # pylint: disable=too-many-instance-attributes
 
+    LIVE_DEBOUNCE = 0.15
+    LIVE_POLL = 40
+
     def _get_button_frame(self):
         """
         Make the bottom button frame.
@@ -56,61 +93,186 @@ class RangeFrame(Tkinter.Frame):
            Tkinter.Button(button_frame, text="Show", command=self.show)
         show_button.pack({"side": "right"})
 
+        matrix_button = Tkinter.Button(
+           button_frame,
+           text="Matrix...",
+           command=self._open_matrix
+        )
+        matrix_button.pack({"side": "right"})
+
+        live_button = Tkinter.Checkbutton(
+           button_frame,
+           text="Live",
+           variable=self.LIVE,
+           command=self._toggle_live
+        )
+        live_button.pack({"side": "right"})
+
+        options_button = Tkinter.Checkbutton(
+           button_frame,
+           text="Options",
+           variable=self.OPTIONS,
+           command=self._toggle_options
+        )
+        options_button.pack({"side": "right"})
+
+        stats_button = Tkinter.Checkbutton(
+           button_frame,
+           text="Stats",
+           variable=self.STATS,
+           command=self._toggle_stats
+        )
+        stats_button.pack({"side": "right"})
+
         return button_frame
 
-    def __init__(self, master=None):
+    def _get_options_frame(self):
         """
-        Initializer.
+        Make the frame that holds the option gadgets.
 
-        :param Tkinter.Widget master: the master
+        :returns: the enclosing frame for the option gadgets
+        :rtype: Tkinter.Frame
         """
-        Tkinter.Frame.__init__(self, master)
-        self.value = None
-        self.pack()
+        options_frame = Tkinter.Frame(self)
 
-        button_frame = self._get_button_frame()
-        button_frame.pack({"side": "bottom"})
+        self.VALUE = ValueConfig(options_frame, "Value")
+        self.VALUE.widget.pack({"side": "left"})
+
+        display = Tkinter.LabelFrame(options_frame, text="Display")
+        display.pack({"side": "left"})
+
+        self.BASE = BaseConfig(display, "Base Options")
+        self.BASE.widget.pack({"side": "top"})
+        self.DIGITS = DigitsConfig(display, "Digits Options")
+        self.DIGITS.widget.pack({"side": "top"})
+        self.STRIP = StripConfig(display, "Strip Options")
+        self.STRIP.widget.pack({"side": "top"})
+        self.MISC = MiscDisplayConfig(display, "Miscellaneous Display Options")
+        self.MISC.widget.pack({"side": "top"})
+
+        return options_frame
+
+    def _get_display_frame(self):
+        """
+        Make the frame that displays the value.
+
+        :returns: the enclosing frame for the value display
+        :rtype: Tkinter.Frame
+        """
+        display_frame = Tkinter.Frame(self)
 
-        self.DISPLAY_STR = Tkinter.StringVar()
         display_label = Tkinter.Label(
-           self,
+           display_frame,
            textvariable=self.DISPLAY_STR,
            font=("Helvetica", 32)
         )
         display_label.pack({"side": "top"})
 
-        self.VALUE_STR = Tkinter.StringVar()
         value_label = Tkinter.Label(
-           self,
+           display_frame,
            textvariable=self.VALUE_STR,
            font=("Courier", 18)
         )
         value_label.pack({"side": "top"})
 
+        return display_frame
+
+    def __init__(
+       self,
+       master=None,
+       config_cache=None,
+       render_cache=None,
+       stats=None
+    ):
+        """
+        Initializer.
+
+        :param Tkinter.Widget master: the master
+        :param config_cache: cache of string configurations
+        :type config_cache: ConfigCache or NoneType
+        :param render_cache: cache of rendered strings
+        :type render_cache: RenderCache or NoneType
+        :param stats: where to record the latencies of show()
+        :type stats: LatencyStats or NoneType
+
+        If a cache is None, the cache shared by all frames is used.
+        If stats is None, the frame records latencies in its own stats.
+        """
+        Tkinter.Frame.__init__(self, master)
+        self.value = None
+        self.stats = LatencyStats() if stats is None else stats
+        self.config_cache = \
+           CONFIG_CACHE if config_cache is None else config_cache
+        self.render_cache = \
+           RENDER_CACHE if render_cache is None else render_cache
+        self.pack()
+
+        self._worker = RenderWorker()
+        self._live_key = None
+        self._live_due = None
+        self._live_after = None
+
+        self.LIVE = Tkinter.BooleanVar()
+        self.LIVE.set(False)
+        self.OPTIONS = Tkinter.BooleanVar()
+        self.OPTIONS.set(False)
+        self.STATS = Tkinter.BooleanVar()
+        self.STATS.set(False)
+        button_frame = self._get_button_frame()
+        button_frame.pack({"side": "bottom"})
+
+        self.STATUS_STR = Tkinter.StringVar()
+        self.STATUS = Tkinter.Label(
+           self,
+           textvariable=self.STATUS_STR,
+           font=("Courier", 10)
+        )
+
+        self.DISPLAY_STR = Tkinter.StringVar()
+        self.VALUE_STR = Tkinter.StringVar()
+        self._get_display_frame().pack({"side": "top"})
+
         self.ERROR_STR = Tkinter.StringVar()
         self.ERROR_STR.set("")
         error = Tkinter.Label(self, textvariable=self.ERROR_STR, fg="red")
         error.pack({"side": "top"})
 
-        self.VALUE = ValueConfig(self, "Value")
-        self.VALUE.widget.pack({"side": "left"})
+        self.OPTIONS_FRAME = None
+        self.VALUE = None
+        self.BASE = None
+        self.DIGITS = None
+        self.STRIP = None
+        self.MISC = None
 
-        display = Tkinter.LabelFrame(self, text="Display")
-        display.pack({"side": "left"})
+    def _toggle_options(self):
+        """
+        Show or hide the option gadgets, building them if necessary.
+        """
+        if self.OPTIONS_FRAME is None:
+            self.OPTIONS_FRAME = self._get_options_frame()
+        if self.OPTIONS.get():
+            self.OPTIONS_FRAME.pack({"side": "top"})
+        else:
+            self.OPTIONS_FRAME.pack_forget()
 
-        self.BASE = BaseConfig(display, "Base Options")
-        self.BASE.widget.pack({"side": "top"})
-        self.DIGITS = DigitsConfig(display, "Digits Options")
-        self.DIGITS.widget.pack({"side": "top"})
-        self.STRIP = StripConfig(display, "Strip Options")
-        self.STRIP.widget.pack({"side": "top"})
-        self.MISC = MiscDisplayConfig(display, "Miscellaneous Display Options")
-        self.MISC.widget.pack({"side": "top"})
+    def _toggle_stats(self):
+        """
+        Show or hide the status bar according to the Stats checkbutton.
+        """
+        if self.STATS.get():
+            self.STATUS_STR.set(self.stats.status())
+            self.STATUS.pack({"side": "bottom"})
+        else:
+            self.STATUS.pack_forget()
 
     def reset(self):
         """
         Reset to defaults and show.
         """
+        if self.OPTIONS_FRAME is None:
+            self.show()
+            return
+
         self.VALUE.set(justbytes.ValueConfig())
 
         display_config = justbytes.DisplayConfig()
@@ -121,53 +283,326 @@ class RangeFrame(Tkinter.Frame):
 
         self.show()
 
+    def _get_options(self):
+        """
+        Get the options selected by the gadgets.
+
+        :returns: the options
+        :rtype: Options
+        :raises GUIError: if a gadget value can not be converted
+        """
+        if self.OPTIONS_FRAME is None:
+            return default_options()
+
+        return Options(
+           value=self.VALUE.get(),
+           base=self.BASE.get(),
+           digits=self.DIGITS.get(),
+           strip=self.STRIP.get(),
+           misc=self.MISC.get()
+        )
+
+    def compile_formatter(self):
+        """
+        Compile a formatter for the options selected by the gadgets.
+
+        :returns: a formatter, a callable from Range to str
+        :rtype: CompiledFormatter
+        :raises GUIError: if a gadget value can not be converted
+        :raises RangeError: if the configuration is invalid
+
+        The formatter does not change if the gadgets do.
+        """
+        return compile_formatter(self.config_cache.get(self._get_options()))
+
+    def _visible_values(self):
+        """
+        The values which are currently displayed.
+
+        :rtype: list of Range
+        """
+        return [] if self.value is None else [self.value]
+
+    def _render(self, string_config):
+        """
+        Render the value according to ``string_config``.
+
+        :param StringConfig string_config: the string configuration
+        :returns: the rendered value
+        :raises RangeError: if the value can not be displayed
+        """
+        return self.render_cache.render(self.value, string_config)
+
+    def _update(self, rendered):
+        """
+        Update the widgets to show a rendered value.
+
+        :param rendered: the value returned by _render()
+        """
+        self.DISPLAY_STR.set(rendered)
+
+    def _display(self, string_config):
+        """
+        Display the value according to ``string_config``.
+
+        :param StringConfig string_config: the string configuration
+        :raises RangeError: if the value can not be displayed
+        """
+        self._update(self._render(string_config))
+
     def show(self):
+        """
+        Show the resulting string, timing each phase.
+        """
+        watch = Stopwatch()
+        try:
+            self._show(watch)
+        finally:
+            self.stats.record(watch.timings)
+            if self.STATS.get():
+                self.STATUS_STR.set(self.stats.status())
+
+    def _show(self, watch):
         """
         Show the resulting string.
+
+        :param Stopwatch watch: times the phases
         """
-        self.VALUE_STR.set(str(self.value.magnitude))
+        if self.value is not None:
+            self.VALUE_STR.set(str(self.value.magnitude))
 
         try:
-            base_config = justbytes.BaseConfig(**self.BASE.get())
-            value_config = justbytes.ValueConfig(**self.VALUE.get())
-            digits_config = justbytes.DigitsConfig(**self.DIGITS.get())
-            strip_config = justbytes.StripConfig(**self.STRIP.get())
-            display_config = justbytes.DisplayConfig(
-               base_config=base_config,
-               digits_config=digits_config,
-               strip_config=strip_config,
-               **self.MISC.get()
-            )
-            string_config = justbytes.StringConfig(
-               value_config,
-               display_config,
-               justbytes.Config.STRING_CONFIG.DISPLAY_IMPL_CLASS
-            )
-        except (GUIValueError, justbytes.RangeError) as err:
+            options = self._get_options()
+            watch.lap("get")
+            string_config = self.config_cache.get(options)
+            watch.lap("config")
+        except _CONFIG_ERRORS as err:
             self.ERROR_STR.set(err)
             return
 
         try:
-            self.DISPLAY_STR.set(
-               self.value.getString(string_config)
-            )
+            rendered = self._render(string_config)
+            watch.lap("render")
         except justbytes.RangeError as err:
             self.ERROR_STR.set(err)
             return
 
+        self._update(rendered)
         self.ERROR_STR.set("")
+        watch.lap("update")
+
+    def _open_matrix(self):
+        """
+        Open a window to explore combinations of options for the value.
+        """
+        values = self._visible_values()
+        if values == []:
+            self.ERROR_STR.set("no value to explore")
+            return
 
+        try:
+            options = self._get_options()
+        except _CONFIG_ERRORS as err:
+            self.ERROR_STR.set(err)
+            return
+
+        MatrixWindow(self, values[0], options)
+
+    def _toggle_live(self):
+        """
+        Start or stop live mode according to the Live checkbutton.
+        """
+        self._worker.cancel()
+        if self._live_after is not None:
+            self.after_cancel(self._live_after)
+            self._live_after = None
+        self._live_key = None
+        self._live_due = None
+        if self.LIVE.get():
+            self._live_after = self.after(self.LIVE_POLL, self._live_tick)
+
+    def _live_tick(self):
+        """
+        Check for changed options and finished renders.
+        """
+        self._live_after = None
+        if not self.LIVE.get():
+            return
+
+        try:
+            options = self._get_options()
+            key = freeze(options)
+        except _CONFIG_ERRORS as err:
+            options = None
+            key = str(err)
+
+        now = time.time()
+        if key != self._live_key:
+            self._live_key = key
+            self._live_due = now + self.LIVE_DEBOUNCE
+            self._worker.cancel()
+        elif self._live_due is not None and now >= self._live_due:
+            self._live_due = None
+            if options is None:
+                self.ERROR_STR.set(key)
+            else:
+                self._submit(options)
+
+        result = self._worker.poll()
+        if result is not None:
+            self._finish(result)
+
+        self._live_after = self.after(self.LIVE_POLL, self._live_tick)
+
+    def _submit(self, options):
+        """
+        Render the visible values in the worker thread.
+
+        :param Options options: the options to render with
+
+        The rendered strings are left in the render cache, so that
+        displaying them afterwards in the Tk thread is cheap.
+        """
+        values = self._visible_values()
+        config_cache = self.config_cache
+        render_cache = self.render_cache
+
+        def job():
+            """
+            Fill the render cache for the visible values.
+
+            :returns: the string configuration
+            :rtype: StringConfig
+            """
+            string_config = config_cache.get(options)
+            for value in values:
+                try:
+                    render_cache.render(value, string_config)
+                except justbytes.RangeError:
+                    pass
+            return string_config
+
+        self._worker.submit(job)
+
+    def _finish(self, result):
+        """
+        Display the result of a render in the worker thread.
+
+        :param Result result: the result
+        """
+        if result.error is not None:
+            self.ERROR_STR.set(result.error)
+            return
+
+        try:
+            self._display(result.value)
+        except justbytes.RangeError as err:
+            self.ERROR_STR.set(err)
+            return
+
+        self.ERROR_STR.set("")
+
+    def destroy(self):
+        self._worker.stop()
+        Tkinter.Frame.destroy(self)
+
+class TableFrame(RangeFrame):
+    """
+    Class to display many Range values in a scrolling table.
+
+    Only the visible rows are formatted, so the cost of showing the values
+    does not depend on how many there are.
+    """
+    # pylint: disable=too-many-ancestors
+
+    def __init__(
+       self,
+       master=None,
+       config_cache=None,
+       render_cache=None,
+       rows=20,
+       stats=None
+    ):
+        """
+        Initializer.
+
+        :param Tkinter.Widget master: the master
+        :param config_cache: cache of string configurations
+        :type config_cache: ConfigCache or NoneType
+        :param render_cache: cache of rendered strings
+        :type render_cache: RenderCache or NoneType
+        :param int rows: the number of visible rows
+        :param stats: where to record the latencies of show()
+        :type stats: LatencyStats or NoneType
+        """
+        # pylint: disable=too-many-arguments
+        self.rows = rows
+        self.TABLE = None
+        RangeFrame.__init__(self, master, config_cache, render_cache, stats)
+
+    def _get_display_frame(self):
+        """
+        Make the table that displays the values.
+
+        :returns: the table
+        :rtype: RangeTable
+        """
+        self.TABLE = RangeTable(self, rows=self.rows)
+        return self.TABLE
+
+    def set_values(self, values):
+        """
+        Set the values to display.
+
+        :param values: the values
+        :type values: sequence or iterable of Range
+        """
+        self.TABLE.set_values(values)
+
+    def _visible_values(self):
+        return self.TABLE.visible()
+
+    def _render(self, string_config):
+        """
+        Render the visible values, leaving them in the render cache.
+
+        :param StringConfig string_config: the string configuration
+        :returns: a function rendering any value from the cache
+        :rtype: callable
+
+        A value which can not be rendered is shown by the table as an error.
+        """
+        render_cache = self.render_cache
+        render = lambda v: render_cache.render(v, string_config)
+        for value in self.TABLE.visible():
+            try:
+                render(value)
+            except justbytes.RangeError:
+                pass
+        return render
+
+    def _update(self, rendered):
+        self.TABLE.render = rendered
+        self.TABLE.redraw()
 
 def show(a_range):
     """
     Start a simple GUI to show display options for ``a_range``.
 
-    :param Range a_range: the range to display
+    If ``a_range`` is not a single Range, but a sequence or other iterable
+    of Ranges, show them all in a table.
+
+    :param a_range: the range or ranges to display
+    :type a_range: Range or iterable of Range
     """
     root = Tkinter.Tk()
     root.wm_title("Justbytes Range Viewer")
-    frame = RangeFrame(master=root)
-    frame.value = a_range
+    if isinstance(a_range, justbytes.Range):
+        frame = RangeFrame(master=root)
+        frame.value = a_range
+    else:
+        frame = TableFrame(master=root)
+        frame.set_values(a_range)
     frame.show()
     frame.mainloop()
     root.destroy()
@@ -0,0 +1,196 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Rendering one value under every combination of some options.
+"""
+import itertools
+import multiprocessing
+import multiprocessing.pool
+import threading
+
+from six.moves import queue
+
+import justbytes
+
+from ._engine import Formatter
+from ._engine import RENDER_CACHE
+from ._engine import field_choices
+from ._engine import format_options
+from ._engine import parse_options
+
+from ._errors import GUIValueError
+
+
+def parse_axes(text):
+    """
+    Parse a description of the axes of a matrix.
+
+    Each non-blank line names a field, optionally followed by a colon and a
+    comma-separated list of values, e.g., "base: 2, 10, 16". If no values
+    are given, all the values of the field are used; that is only possible
+    for fields with a few values, such as rounding_method or binary_units.
+
+    :param str text: the description
+    :returns: the name of each axis and its values, as text
+    :rtype: list of tuple of str * (list of str)
+    :raises GUIValueError: if the description is bad
+    """
+    axes = []
+    for line in text.splitlines():
+        if line.strip() == "":
+            continue
+
+        (name, _, values) = line.partition(":")
+        name = name.strip()
+        values = [v.strip() for v in values.split(",") if v.strip() != ""]
+        if values == []:
+            values = field_choices(name)
+            if values is None:
+                raise GUIValueError("values must be given for \"%s\"" % name)
+        for value in values:
+            parse_options({name: value})
+        axes.append((name, values))
+
+    if axes == []:
+        raise GUIValueError("no axes given")
+
+    return axes
+
+
+def combinations(texts, axes):
+    """
+    Every combination of the values of ``axes``, applied to ``texts``.
+
+    :param texts: the textual options that the axes modify
+    :type texts: dict of str * str
+    :param axes: the axes, as returned by parse_axes()
+    :type axes: list of tuple of str * (list of str)
+    :returns: the position along each axis and the options, as text
+    :rtype: generator of tuple of (tuple of int) * (dict of str * str)
+    """
+    ranges = [range(len(values)) for (_, values) in axes]
+    for index in itertools.product(*ranges):
+        combination = dict(texts)
+        combination.update(
+           (name, values[i]) for ((name, values), i) in zip(axes, index)
+        )
+        yield (index, combination)
+
+
+def _render_cell(task):
+    """
+    Render a value for one combination.
+
+    :param task: the position, the value, and the options as text
+    :type task: tuple of (tuple of int) * Range * (dict of str * str)
+    :returns: the position, the string and an error message, one None
+    :rtype: tuple of (tuple of int) * (str or NoneType) * (str or NoneType)
+    """
+    (index, value, texts) = task
+    try:
+        formatter = Formatter(parse_options(texts), render_cache=RENDER_CACHE)
+        return (index, formatter.format(value), None)
+    except (GUIValueError, justbytes.RangeError) as err:
+        return (index, None, str(err))
+
+
+class MatrixRender(object):
+    """
+    Renders a value under every combination of options, concurrently.
+
+    Results arrive in the order in which they finish. A background thread
+    collects them from the pool, and results() hands them over without
+    blocking, so that a GUI may fill in its grid on after() ticks.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, value, options, axes, jobs=None, use_threads=False):
+        """
+        Initializer.
+
+        :param Range value: the value to render
+        :param Options options: the options that the axes modify
+        :param axes: the axes, as returned by parse_axes()
+        :type axes: list of tuple of str * (list of str)
+        :param jobs: the number of workers, if None, one per CPU
+        :type jobs: int or NoneType
+        :param bool use_threads: use threads rather than processes
+        """
+        # pylint: disable=too-many-arguments
+        self.value = value
+        self.axes = axes
+        self.total = 1
+        for (_, values) in axes:
+            self.total *= len(values)
+        self.received = 0
+
+        self._texts = format_options(options)
+        if use_threads:
+            self._pool = multiprocessing.pool.ThreadPool(jobs)
+        else:
+            self._pool = multiprocessing.Pool(jobs)
+        self._results = queue.Queue()
+        self._thread = None
+
+    done = property(
+       lambda s: s.received == s.total,
+       doc="True if every result has been received"
+    )
+
+    def start(self):
+        """
+        Start rendering.
+        """
+        tasks = (
+           (index, self.value, texts) for (index, texts) in \
+              combinations(self._texts, self.axes)
+        )
+        results = self._pool.imap_unordered(_render_cell, tasks)
+        self._thread = threading.Thread(target=self._collect, args=(results,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _collect(self, results):
+        """
+        Move results from the pool to the queue.
+
+        :param results: the results from the pool
+        """
+        for result in results:
+            self._results.put(result)
+        self._pool.close()
+
+    def results(self):
+        """
+        Get the results that have arrived since the last call.
+
+        :returns: the position, the string and an error message, one None
+        :rtype: list of tuple of (tuple of int) * str * str
+        """
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        self.received += len(results)
+        return results
+
+    def cancel(self):
+        """
+        Stop rendering, discarding any work not yet done.
+        """
+        self._pool.terminate()
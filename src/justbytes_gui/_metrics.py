@@ -0,0 +1,191 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Timing the phases of showing a value.
+"""
+import json
+import threading
+
+from collections import deque
+from timeit import default_timer
+
+from ._errors import GUIValueError
+
+
+# The phases of showing a value, in order: getting the options from the
+# gadgets, making the justbytes configuration, getting the string, and
+# updating the Tk variables and widgets.
+PHASES = ("get", "config", "render", "update")
+
+
+class Stopwatch(object):
+    """
+    Times consecutive phases.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self):
+        """
+        Initializer.
+        """
+        self.timings = dict()
+        self._last = default_timer()
+
+    def lap(self, phase):
+        """
+        Record the time since the previous lap as the time of ``phase``.
+
+        :param str phase: the phase which has just finished
+        """
+        now = default_timer()
+        self.timings[phase] = now - self._last
+        self._last = now
+
+
+class LatencyStats(object):
+    """
+    The latencies of the most recent times a value was shown, by phase.
+
+    Hooks are called with the timings of each show, a dict from phase to
+    seconds, after the timings have been recorded. A show that fails part
+    way through has timings only for the phases that it completed.
+    """
+
+    def __init__(self, window=256):
+        """
+        Initializer.
+
+        :param int window: the number of latencies kept for each phase
+        :raises GUIValueError: if window is less than 1
+        """
+        if window < 1:
+            raise GUIValueError("window must be at least 1, is %s" % window)
+
+        self.window = window
+        self._samples = dict((p, deque(maxlen=window)) for p in PHASES)
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Add a hook, called with the timings of every show.
+
+        :param hook: the hook
+        :type hook: callable taking a dict of str * float
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """
+        Remove a hook added by add_hook().
+
+        :param hook: the hook
+        """
+        self._hooks.remove(hook)
+
+    def record(self, timings):
+        """
+        Record the timings of one show.
+
+        :param timings: map from phase to seconds
+        :type timings: dict of str * float
+        """
+        with self._lock:
+            for (phase, seconds) in timings.items():
+                self._samples[phase].append(seconds)
+
+        for hook in list(self._hooks):
+            hook(timings)
+
+    def clear(self):
+        """
+        Discard all recorded latencies.
+        """
+        with self._lock:
+            for samples in self._samples.values():
+                samples.clear()
+
+    def percentile(self, phase, percent):
+        """
+        Get a percentile of the recorded latencies of ``phase``.
+
+        :param str phase: the phase
+        :param percent: the percentile, from 0 to 100
+        :type percent: int or float
+        :returns: the latency in seconds, or None if there are none
+        :rtype: float or NoneType
+
+        Uses the nearest-rank method, so the result is always a latency
+        that was actually recorded.
+        """
+        with self._lock:
+            samples = sorted(self._samples[phase])
+        if samples == []:
+            return None
+        rank = int(round(percent / 100.0 * (len(samples) - 1)))
+        return samples[rank]
+
+    def summary(self, percents=(50, 90, 99)):
+        """
+        Get the count, some percentiles and the maximum for every phase.
+
+        :param percents: the percentiles to include
+        :type percents: sequence of int
+        :returns: map from phase to a map from statistic to value
+        :rtype: dict of str * (dict of str * (int or float or NoneType))
+
+        The statistics are "count", "max" and "p<percent>" for each
+        percentile; latencies are in seconds.
+        """
+        result = dict()
+        for phase in PHASES:
+            with self._lock:
+                samples = list(self._samples[phase])
+            stats = dict(
+               ("p%s" % p, self.percentile(phase, p)) for p in percents
+            )
+            stats["count"] = len(samples)
+            stats["max"] = max(samples) if samples else None
+            result[phase] = stats
+        return result
+
+    def to_json(self):
+        """
+        Export the summary as JSON.
+
+        :returns: the summary, as returned by summary(), in JSON
+        :rtype: str
+        """
+        return json.dumps(
+           {"window": self.window, "phases": self.summary()},
+           sort_keys=True
+        )
+
+    def status(self):
+        """
+        A one-line description of the median and 99th percentile latencies.
+
+        :rtype: str
+        """
+        parts = []
+        for phase in PHASES:
+            (median, worst) = \
+               (self.percentile(phase, 50), self.percentile(phase, 99))
+            if median is not None:
+                parts.append(
+                   "%s %.2f/%.2f" % (phase, median * 1000, worst * 1000)
+                )
+        return "ms p50/p99: " + ", ".join(parts) if parts else ""
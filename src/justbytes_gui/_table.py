@@ -0,0 +1,203 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+A table of Range values which renders only the rows that are visible.
+"""
+import itertools
+import Tkinter
+
+import justbytes
+
+
+class Rows(object):
+    """
+    Random access to a collection of Range values.
+
+    A sequence, i.e., anything with a length that supports indexing, is
+    used as is, without copying. Any other iterable is read only as far
+    as it has been asked for, so a generator is never exhausted up front.
+    """
+
+    def __init__(self, values):
+        """
+        Initializer.
+
+        :param values: the values
+        :type values: sequence or iterable of Range
+        """
+        if hasattr(values, "__len__") and hasattr(values, "__getitem__"):
+            self._values = values
+            self._iterator = None
+        else:
+            self._values = []
+            self._iterator = iter(values)
+
+    complete = property(
+       lambda s: s._iterator is None,
+       doc="True if all values are known"
+    )
+
+    def __len__(self):
+        """
+        The number of values known so far.
+        """
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def extend_to(self, stop):
+        """
+        Read values from the iterable until at least ``stop`` are known.
+
+        :param int stop: the number of values required
+        """
+        if self._iterator is None or stop <= len(self._values):
+            return
+        self._values.extend(
+           itertools.islice(self._iterator, stop - len(self._values))
+        )
+        if len(self._values) < stop:
+            self._iterator = None
+
+
+class RangeTable(Tkinter.Frame):
+    """
+    Table of Range values and their string representations.
+
+    Only ``rows`` rows of widgets exist; scrolling changes which values
+    they show, so the cost of a redraw does not depend on the number of
+    values in the table.
+    """
+    # pylint: disable=too-many-ancestors
+
+    def __init__(self, master=None, rows=20):
+        """
+        Initializer.
+
+        :param Tkinter.Widget master: the master
+        :param int rows: the number of visible rows
+        """
+        Tkinter.Frame.__init__(self, master)
+        self.rows = rows
+        self.offset = 0
+        self.render = None
+        self.values = Rows([])
+
+        self.SCROLLBAR = Tkinter.Scrollbar(self, command=self.yview)
+        self.SCROLLBAR.pack({"side": "right", "fill": "y"})
+
+        self.VALUES = Tkinter.Listbox(
+           self,
+           height=rows,
+           width=32,
+           font=("Courier", 12),
+           activestyle="none"
+        )
+        self.VALUES.pack({"side": "left"})
+
+        self.DISPLAY = Tkinter.Listbox(
+           self,
+           height=rows,
+           width=32,
+           font=("Helvetica", 12),
+           activestyle="none"
+        )
+        self.DISPLAY.pack({"side": "left"})
+
+        for widget in (self.VALUES, self.DISPLAY):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", self._on_wheel)
+            widget.bind("<Button-5>", self._on_wheel)
+
+    def set_values(self, values):
+        """
+        Set the values to display and scroll to the top.
+
+        :param values: the values
+        :type values: sequence or iterable of Range
+        """
+        self.values = Rows(values)
+        self.offset = 0
+
+    def _on_wheel(self, event):
+        """
+        Scroll in response to a mouse wheel event.
+
+        X11 reports the wheel as buttons 4 and 5, other platforms as a delta.
+        """
+        up = event.num == 4 or event.delta > 0
+        self.yview("scroll", -1 if up else 1, "units")
+
+    def _row_string(self, value):
+        """
+        Render a single value.
+
+        :param Range value: the value
+        :returns: the string to display for this value
+        :rtype: str
+        """
+        try:
+            return self.render(value)
+        except justbytes.RangeError as err:
+            return str(err)
+
+    def yview(self, *args):
+        """
+        Scroll the table, with the arguments of a Scrollbar command.
+        """
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * len(self.values))
+        else:
+            step = self.rows if args[2] == "pages" else 1
+            offset = self.offset + int(args[1]) * step
+        self.values.extend_to(offset + self.rows)
+        self.offset = max(0, min(offset, len(self.values) - self.rows))
+        self.redraw()
+
+    def visible(self):
+        """
+        The values in the visible rows.
+
+        :rtype: list of Range
+        """
+        self.values.extend_to(self.offset + self.rows)
+        stop = min(self.offset + self.rows, len(self.values))
+        return [self.values[i] for i in range(self.offset, stop)]
+
+    def redraw(self):
+        """
+        Render the visible rows.
+        """
+        visible = self.visible()
+
+        self.VALUES.delete(0, Tkinter.END)
+        self.DISPLAY.delete(0, Tkinter.END)
+        for value in visible:
+            self.VALUES.insert(Tkinter.END, str(value.magnitude))
+            if self.render is not None:
+                self.DISPLAY.insert(Tkinter.END, self._row_string(value))
+
+        total = len(self.values)
+        if total == 0:
+            self.SCROLLBAR.set(0.0, 1.0)
+        else:
+            if not self.values.complete:
+                total = total + self.rows
+            self.SCROLLBAR.set(
+               float(self.offset) / total,
+               float(self.offset + len(visible)) / total
+            )
@@ -0,0 +1,203 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Choosing the unit in which to show a value.
+
+justbytes chooses a unit by converting a value to every unit in turn and
+comparing each result with the minimum value. Here, the smallest magnitude
+shown in each unit is computed once for each choice of units and minimum
+value, and the unit is found by a binary search. Whether a value is exact
+in a unit is decided by counting the factors of the value that the unit
+removes, rather than by converting the value.
+"""
+import bisect
+
+from fractions import Fraction
+
+import justbytes
+
+from ._cache import LRUCache
+
+
+def _factorize(number):
+    """
+    The prime factors of a small positive integer.
+
+    :param int number: the integer
+    :returns: the exponent of each prime factor
+    :rtype: dict of int * int
+    """
+    factors = dict()
+    prime = 2
+    while number > 1:
+        while number % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            number //= prime
+        prime += 1
+    return factors
+
+
+def _valuation(number, prime, limit):
+    """
+    The exponent of ``prime`` in ``number``, but at most ``limit``.
+
+    :param int number: a non-zero integer
+    :param int prime: a prime
+    :param int limit: the most factors counted
+    :rtype: int
+    """
+    if prime == 2:
+        number = abs(number)
+        return min((number & -number).bit_length() - 1, limit)
+
+    count = 0
+    while count < limit and number % prime == 0:
+        number //= prime
+        count += 1
+    return count
+
+
+class UnitIndex(object):
+    """
+    The units for one choice of binary_units and min_value, with the
+    smallest magnitude shown in each unit, in increasing order.
+    """
+
+    def __init__(self, binary_units=True, min_value=1):
+        """
+        Initializer.
+
+        :param bool binary_units: whether to use binary units
+        :param min_value: the minimum value shown in a unit
+        :type min_value: any precise numeric type
+        """
+        self.units = [
+           unit for (_, unit) in \
+              justbytes.Range(0).componentsList(binary_units)
+        ]
+        factor = justbytes.KiB.factor if binary_units else justbytes.KB.factor
+        limit = factor * Fraction(min_value)
+
+        # A value is shown in the first unit in which its magnitude is less
+        # than limit; an integer value, in the first unit in which it is less
+        # than the ceiling of limit times the unit's factor.
+        self.thresholds = [limit * int(unit.factor) for unit in self.units[:-1]]
+        self.integer_thresholds = [-(-t // 1) for t in self.thresholds]
+
+        self._factors = _factorize(int(factor))
+
+    def index(self, magnitude):
+        """
+        The index of the unit in which ``magnitude`` is shown.
+
+        :param magnitude: the magnitude, in bytes
+        :type magnitude: int or Fraction
+        :rtype: int
+        """
+        magnitude = abs(magnitude)
+        if getattr(magnitude, "denominator", 1) == 1:
+            return bisect.bisect_right(self.integer_thresholds, int(magnitude))
+        return bisect.bisect_right(self.thresholds, magnitude)
+
+    def is_exact(self, magnitude, index, base, max_places):
+        """
+        Whether ``magnitude`` is exact in the unit at ``index``.
+
+        :param magnitude: the magnitude, in bytes
+        :type magnitude: int or Fraction
+        :param int index: the index of the unit
+        :param int base: the base
+        :param max_places: the number of places, if None, unbounded
+        :type max_places: int or NoneType
+        :rtype: bool
+        """
+        if max_places is None or magnitude == 0:
+            return True
+
+        magnitude = Fraction(magnitude)
+        if magnitude.denominator != 1:
+            denominator = \
+               (magnitude / int(self.units[index].factor)).denominator
+            return base ** max_places % denominator == 0
+
+        # The denominator in the unit is its factor, less the factors that
+        # the magnitude shares with it. Every remaining factor must be a
+        # factor of base ** max_places.
+        for (prime, exponent) in self._factors.items():
+            remaining = exponent * index - \
+               _valuation(magnitude.numerator, prime, exponent * index)
+            if remaining == 0:
+                continue
+            available = _valuation(base, prime, remaining)
+            if available == 0 or -(-remaining // available) > max_places:
+                return False
+        return True
+
+    def select(self, magnitude, config):
+        """
+        The index of the unit in which ``magnitude`` is shown by ``config``.
+
+        :param magnitude: the magnitude, in bytes
+        :type magnitude: int or Fraction
+        :param ValueConfig config: the value configuration, with no unit
+        :rtype: int
+        """
+        index = self.index(magnitude)
+        if not config.exact_value:
+            return index
+
+        for candidate in range(index, 0, -1):
+            if self.is_exact(
+               magnitude,
+               candidate,
+               config.base,
+               config.max_places
+            ):
+                return candidate
+        return 0
+
+    def components(self, value, config):
+        """
+        The value in the unit chosen by ``config``, as Range.components().
+
+        :param Range value: the value
+        :param ValueConfig config: the value configuration
+        :returns: the value in the unit and the unit
+        :rtype: tuple of Fraction * unit
+        """
+        if config.unit is not None:
+            return value.components(config)
+
+        magnitude = value.magnitude
+        unit = self.units[self.select(magnitude, config)]
+        return (magnitude / int(unit.factor), unit)
+
+
+# Indices, by binary_units and min_value.
+_INDICES = LRUCache(maxsize=16)
+
+
+def unit_index(binary_units=True, min_value=1):
+    """
+    The shared index for ``binary_units`` and ``min_value``.
+
+    :param bool binary_units: whether to use binary units
+    :param min_value: the minimum value shown in a unit
+    :type min_value: any precise numeric type
+    :rtype: UnitIndex
+    """
+    key = (bool(binary_units), Fraction(min_value))
+    return _INDICES.get(key, lambda: UnitIndex(*key))
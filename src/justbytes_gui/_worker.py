@@ -0,0 +1,129 @@
+# Copyright (C) 2016 Anne Mulhern
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+#
+# Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Running renders off the Tk event thread.
+"""
+import threading
+
+from collections import namedtuple
+
+from six.moves import queue
+
+
+Result = namedtuple("Result", ["generation", "value", "error"])
+
+
+class RenderWorker(object):
+    """
+    A background thread that runs one job at a time.
+
+    Only the most recently submitted job is wanted. Submitting a job
+    replaces any job that has not yet started, and the result of a job
+    that has been superseded or cancelled is dropped. A job that is
+    already running can not be interrupted, but its result is never seen.
+
+    Results are collected by calling poll(), which is meant to be called
+    from the Tk thread on after() ticks, so that only that thread touches
+    any widget.
+    """
+
+    def __init__(self):
+        """
+        Initializer.
+        """
+        self._condition = threading.Condition()
+        self._pending = None
+        self._generation = 0
+        self._stopped = False
+        self._results = queue.Queue()
+        self._thread = None
+
+    def _run(self):
+        """
+        Run jobs until stopped.
+        """
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                (generation, job) = self._pending
+                self._pending = None
+
+            try:
+                result = Result(generation, job(), None)
+            except Exception as err: # pylint: disable=broad-except
+                result = Result(generation, None, err)
+
+            if generation == self._generation:
+                self._results.put(result)
+
+    def submit(self, job):
+        """
+        Submit a job, superseding any earlier job.
+
+        :param job: the job, called with no arguments in the worker thread
+        :type job: callable
+        :returns: the generation of this job
+        :rtype: int
+        """
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._generation += 1
+            self._pending = (self._generation, job)
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self):
+        """
+        Drop any pending job, and the result of any running job.
+        """
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+
+    def poll(self):
+        """
+        Get the result of the latest job, if it has finished.
+
+        :returns: the result or None if there is no current result
+        :rtype: Result or NoneType
+
+        If the job raised an exception, it is the error field of the result.
+        """
+        latest = None
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if result.generation == self._generation:
+                latest = result
+        return latest
+
+    def stop(self):
+        """
+        Stop the worker thread once any running job is done.
+        """
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._stopped = True
+            self._condition.notify()
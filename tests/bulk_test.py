@@ -0,0 +1,103 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for bulk formatting. """
+import itertools
+import unittest
+
+import justbytes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from justbytes_gui._bulk import format_sizes
+from justbytes_gui._engine import make_string_config
+from justbytes_gui._engine import parse_options
+
+
+_INTS = [
+   0, 1, -1, 999, 1000, 1023, 1024, 1025, -1536, 5 * 1024 ** 3 + 3,
+   10 ** 18, -10 ** 18 - 7, 2 ** 63 - 1, -2 ** 63
+]
+
+
+class FormatSizesTestCase(unittest.TestCase):
+    """ Test that bulk formatting agrees with Range.getString(). """
+
+    def _check(self, values, options):
+        """
+        Check that every value is formatted as by Range.getString().
+
+        :param values: the values
+        :param Options options: the options
+        """
+        string_config = make_string_config(options)
+        expected = [
+           justbytes.Range(int(v)).getString(string_config) for v in values
+        ]
+        self.assertEqual(format_sizes(values, options), expected)
+
+    def testList(self):
+        """ A list is formatted one value at a time. """
+        self._check(_INTS, parse_options({}))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def testArrays(self):
+        """ Integer arrays with various options. """
+        arrays = [
+           numpy.array(_INTS, dtype=numpy.int64),
+           numpy.array([abs(i) for i in _INTS] + [2 ** 64 - 1], dtype="u8"),
+           numpy.array(_INTS + [2 ** 70], dtype=object)
+        ]
+        cases = itertools.chain(
+           itertools.product(
+              ("none", "KiB", "EiB", "kB"),
+              ("2", "10", "16"),
+              ("0", "2", "20"),
+              ("true", "false"),
+              (justbytes.ROUND_HALF_ZERO,)
+           ),
+           itertools.product(
+              ("none", "kB"),
+              ("10",),
+              ("2",),
+              ("true",),
+              justbytes.ROUNDING_METHODS()
+           )
+        )
+        for (unit, base, places, binary, method) in cases:
+            options = parse_options(
+               {
+                  "unit": unit,
+                  "base": base,
+                  "max_places": places,
+                  "binary_units": binary,
+                  "use_letters": "true"
+               }
+            )
+            options.value["rounding_method"] = method
+            for values in arrays:
+                self._check(values, options)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def testExactValue(self):
+        """ With exact_value, an array is formatted one value at a time. """
+        values = numpy.array(_INTS, dtype=numpy.int64)
+        self._check(values, parse_options({"exact_value": "true"}))
@@ -0,0 +1,166 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for caches. """
+import unittest
+
+import justbytes
+
+from justbytes_gui._cache import LRUCache
+from justbytes_gui._engine import ConfigCache
+from justbytes_gui._engine import Options
+from justbytes_gui._engine import RenderCache
+from justbytes_gui._errors import GUIValueError
+
+
+def _options(**kwargs):
+    """
+    Options for the default configuration, modified by ``kwargs``.
+
+    :returns: the options
+    :rtype: Options
+    """
+    value = {
+       "base": 10,
+       "binary_units": True,
+       "exact_value": False,
+       "max_places": 2,
+       "min_value": 1,
+       "rounding_method": justbytes.ROUND_HALF_ZERO,
+       "unit": None
+    }
+    value.update(kwargs)
+    return Options(
+       value=value,
+       base={"use_prefix": False, "use_subscript": False},
+       digits={"separator": "~", "use_caps": False, "use_letters": True},
+       strip={"strip": False, "strip_exact": False, "strip_whole": True},
+       misc={"show_approx_str": True}
+    )
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    """ Test the generic cache. """
+
+    def testEviction(self):
+        """ The least recently used entry is evicted. """
+        cache = LRUCache(2)
+        cache.get(1, lambda: "one")
+        cache.get(2, lambda: "two")
+        cache.get(1, lambda: "uno")
+        cache.get(3, lambda: "three")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(1, lambda: "uno"), "one")
+        self.assertEqual(cache.get(2, lambda: "dos"), "dos")
+
+    def testStats(self):
+        """ Hits and misses are counted. """
+        cache = LRUCache(4)
+        for key in (1, 2, 1, 1, 3):
+            cache.get(key, lambda: None)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (2, 3, 3))
+        cache.clear()
+        self.assertEqual(cache.stats().hits, 0)
+
+    def testException(self):
+        """ Nothing is cached if the factory fails. """
+        cache = LRUCache(4)
+        def factory():
+            """ A failing factory. """
+            raise ValueError()
+        with self.assertRaises(ValueError):
+            cache.get(1, factory)
+        self.assertEqual(len(cache), 0)
+
+    def testBadSize(self):
+        """ A cache must have room for something. """
+        with self.assertRaises(GUIValueError):
+            LRUCache(0)
+
+
+class ConfigCacheTestCase(unittest.TestCase):
+    """ Test the cache of string configurations. """
+
+    def testReuse(self):
+        """ Toggling back to earlier options gets the same object. """
+        cache = ConfigCache()
+        first = cache.get(_options())
+        second = cache.get(_options(base=16))
+        self.assertIsNot(first, second)
+        self.assertIs(cache.get(_options()), first)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 2)
+
+    def testResult(self):
+        """ The configuration renders like one built directly. """
+        config = ConfigCache().get(_options(max_places=3))
+        value = justbytes.Range(1000, justbytes.KiB)
+        self.assertEqual(
+           value.getString(config),
+           value.getString(
+              justbytes.StringConfig(
+                 justbytes.ValueConfig(max_places=3),
+                 justbytes.DisplayConfig(),
+                 justbytes.Config.STRING_CONFIG.DISPLAY_IMPL_CLASS
+              )
+           )
+        )
+
+    def testInvalid(self):
+        """ An invalid configuration raises and is not cached. """
+        cache = ConfigCache()
+        with self.assertRaises(justbytes.RangeError):
+            cache.get(_options(base=1))
+        self.assertEqual(cache.stats().size, 0)
+
+
+class RenderCacheTestCase(unittest.TestCase):
+    """ Test the cache of rendered strings. """
+
+    def testReuse(self):
+        """ Equal magnitudes under the same configuration hit. """
+        configs = ConfigCache()
+        cache = RenderCache()
+        config = configs.get(_options(base=7, max_places=None))
+        value = justbytes.Range(3, justbytes.TiB)
+        first = cache.render(value, config)
+        self.assertEqual(first, value.getString(config))
+        cache.render(justbytes.Range(value), configs.get(_options()))
+        cache.render(justbytes.Range(value), config)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 2)
+
+    def testDisplayOnly(self):
+        """ Changing only display options reuses the value stage. """
+        configs = ConfigCache()
+        cache = RenderCache()
+        value = justbytes.Range(1023, justbytes.GiB)
+        options = _options(base=16, max_places=None)
+        first = configs.get(options)
+        options.digits["use_caps"] = True
+        options.base["use_prefix"] = True
+        second = configs.get(options)
+        self.assertIs(first.VALUE_CONFIG, second.VALUE_CONFIG)
+        for config in (first, second):
+            self.assertEqual(
+               cache.render(value, config),
+               value.getString(config)
+            )
+        self.assertEqual(cache.value_stats().hits, 1)
+        self.assertEqual(cache.value_stats().misses, 1)
@@ -0,0 +1,108 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for compiled formatters. """
+import itertools
+import unittest
+
+from fractions import Fraction
+
+import justbytes
+
+from justbytes_gui._compiled import compile_formatter
+from justbytes_gui._engine import make_string_config
+from justbytes_gui._engine import parse_options
+
+
+_VALUES = [
+   justbytes.Range(v) for v in (
+      0, 1, -1, 1023, 1024, 1025, -1536, 999999, 5 * 1024 ** 3 + 1,
+      10 ** 18 + 12345, -(2 ** 70) - 3, 2 ** 90, Fraction(1, 3),
+      Fraction(-7, 2)
+   )
+]
+
+
+def _string_config(texts, method=justbytes.ROUND_HALF_ZERO):
+    """
+    Make a string configuration.
+
+    :param texts: the options, as for parse_options()
+    :type texts: dict of str * str
+    :param method: the rounding method
+    :rtype: StringConfig
+    """
+    options = parse_options(texts)
+    options.value["rounding_method"] = method
+    return make_string_config(options)
+
+
+class CompiledFormatterTestCase(unittest.TestCase):
+    """ Test that compiled formatters agree with Range.getString(). """
+
+    def _check(self, string_config):
+        """
+        Check every value against Range.getString().
+
+        :param StringConfig string_config: the string configuration
+        :returns: whether the formatter is specialized
+        :rtype: bool
+        """
+        formatter = compile_formatter(string_config)
+        for value in _VALUES:
+            self.assertEqual(formatter(value), value.getString(string_config))
+        return formatter.specialized
+
+    def testValue(self):
+        """ Every unit, base, number of places, and rounding method. """
+        units = ("B", "KiB", "GiB", "EiB", "kB", "MB")
+        for (unit, base, places, method) in itertools.product(
+           units,
+           (2, 8, 10, 16, 32, 7),
+           ("0", "1", "3", "none"),
+           justbytes.ROUNDING_METHODS()
+        ):
+            exact = unit == "B" or (base == 10 and unit.endswith("iB"))
+            if places == "none" and not exact:
+                continue
+            texts = {
+               "unit": unit,
+               "base": str(base),
+               "max_places": places,
+               "use_letters": "true"
+            }
+            specialized = self._check(_string_config(texts, method))
+            self.assertEqual(specialized, base != 7)
+
+    def testDisplay(self):
+        """ Every combination of display options. """
+        names = (
+           "use_letters", "use_caps", "strip", "strip_exact", "strip_whole",
+           "show_approx_str", "use_prefix", "use_subscript"
+        )
+        for (base, flags) in itertools.product(
+           (2, 10, 16),
+           itertools.product(("false", "true"), repeat=len(names))
+        ):
+            texts = dict(zip(names, flags))
+            texts.update({"unit": "MiB", "base": str(base), "max_places": "2"})
+            self._check(_string_config(texts))
+
+    def testGeneric(self):
+        """ Without a fixed unit, values are formatted in the usual way. """
+        self.assertFalse(self._check(_string_config({"max_places": "2"})))
@@ -0,0 +1,111 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for fast digit generation. """
+import itertools
+import unittest
+
+from fractions import Fraction
+
+import justbases
+import justbytes
+
+from justbytes_gui._digits import from_rational
+from justbytes_gui._digits import int_digits
+from justbytes_gui._digits import string_info
+
+
+def _parts(radix):
+    """
+    The parts of a radix, for comparison.
+
+    :param Radix radix: the radix
+    :rtype: tuple
+    """
+    return (
+       radix.sign,
+       radix.integer_part,
+       radix.non_repeating_part,
+       radix.repeating_part,
+       radix.base
+    )
+
+
+class IntDigitsTestCase(unittest.TestCase):
+    """ Test converting ints. """
+
+    def testConvert(self):
+        """ The digits are those of justbases, for large and small values. """
+        values = [0, 1, 6, 7, 48, 49, 2 ** 64 - 1, 3 ** 500 + 17, 10 ** 700]
+        for (value, base) in itertools.product(values, [2, 7, 10, 16, 1000]):
+            self.assertEqual(
+               int_digits(value, base),
+               justbases.Nats.convert_from_int(value, base)
+            )
+
+
+class FromRationalTestCase(unittest.TestCase):
+    """ Test converting rationals. """
+
+    def testSame(self):
+        """ The results are those of justbases. """
+        values = [
+           Fraction(n, d) for (n, d) in \
+              itertools.product([0, 1, -5, 25, 2 ** 70 + 1], [1, 3, 8, 1000])
+        ]
+        for (value, base, precision, method) in itertools.product(
+           values,
+           [2, 3, 10, 1024],
+           [0, 2, 30],
+           justbytes.ROUNDING_METHODS()
+        ):
+            (radix, relation) = \
+               from_rational(value, base, precision, method)
+            (expected, expected_relation) = justbases.Radices.from_rational(
+               value,
+               base,
+               precision,
+               method
+            )
+            self.assertEqual(
+               (_parts(radix), relation),
+               (_parts(expected), expected_relation)
+            )
+
+
+class StringInfoTestCase(unittest.TestCase):
+    """ Test the value stage. """
+
+    def testSame(self):
+        """ The results are those of Range.getStringInfo(). """
+        ranges = [justbytes.Range(n) for n in (0, 1023, 10 ** 18 + 7, -4097)]
+        for (value, exact_value, binary_units, max_places) in \
+           itertools.product(ranges, [True, False], [True, False], [0, 3]):
+            config = justbytes.ValueConfig(
+               base=10,
+               binary_units=binary_units,
+               exact_value=exact_value,
+               max_places=max_places
+            )
+            (radix, relation, unit) = string_info(value, config)
+            (expected, expected_relation, expected_unit) = \
+               value.getStringInfo(config)
+            self.assertEqual(
+               (_parts(radix), relation, unit),
+               (_parts(expected), expected_relation, expected_unit)
+            )
@@ -0,0 +1,83 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for headless formatting. """
+import unittest
+
+import justbytes
+
+from justbytes_gui._batch import format_lines
+from justbytes_gui._engine import Formatter
+from justbytes_gui._engine import default_options
+from justbytes_gui._engine import format_options
+from justbytes_gui._engine import parse_options
+from justbytes_gui._errors import GUIValueError
+
+
+class OptionsTestCase(unittest.TestCase):
+    """ Test textual options. """
+
+    def testRoundTrip(self):
+        """ Formatted options parse back to the same options. """
+        options = parse_options({
+           "rounding_method": "half up",
+           "unit": "MiB",
+           "max_places": "none",
+           "min_value": "0.5",
+           "use_caps": "yes"
+        })
+        self.assertIs(options.value["rounding_method"], justbytes.ROUND_HALF_UP)
+        self.assertIs(options.value["unit"], justbytes.MiB)
+        self.assertIsNone(options.value["max_places"])
+        self.assertTrue(options.digits["use_caps"])
+        self.assertEqual(parse_options(format_options(options)), options)
+
+    def testDefaults(self):
+        """ The defaults are the justbytes defaults. """
+        value = justbytes.Range(12345678)
+        self.assertEqual(
+           Formatter(default_options()).format(value),
+           str(value)
+        )
+
+    def testBad(self):
+        """ Unknown fields and bad values are rejected. """
+        for texts in ({"bogus": "1"}, {"base": "ten"}, {"strip": "maybe"}):
+            with self.assertRaises(GUIValueError):
+                parse_options(texts)
+
+    def testDecimalMinValue(self):
+        """ A Decimal min_value, as the GUI supplies, is usable. """
+        options = parse_options({"min_value": "0.1"})
+        value = justbytes.Range(768, justbytes.MiB)
+        self.assertEqual(Formatter(options).format(value), "0.75 GiB")
+
+
+class FormatLinesTestCase(unittest.TestCase):
+    """ Test formatting streams of lines. """
+
+    def testOrder(self):
+        """ Results are in input order, with or without a pool. """
+        lines = ["%d\n" % (i * 1000003) for i in range(50)] + ["x\n"]
+        texts = {"binary_units": "false"}
+        serial = list(format_lines(lines, texts))
+        pooled = list(format_lines(lines, texts, jobs=2, chunk_size=7))
+        self.assertEqual(serial, pooled)
+        self.assertEqual(serial[1], ("> 1.00 MB", None))
+        self.assertIsNone(serial[-1][0])
+        self.assertIsNotNone(serial[-1][1])
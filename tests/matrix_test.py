@@ -0,0 +1,73 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for the option matrix. """
+import time
+import unittest
+
+import justbytes
+
+from justbytes_gui._engine import default_options
+from justbytes_gui._errors import GUIValueError
+from justbytes_gui._matrix import MatrixRender
+from justbytes_gui._matrix import parse_axes
+
+
+class ParseAxesTestCase(unittest.TestCase):
+    """ Test parsing the axes of a matrix. """
+
+    def testChoices(self):
+        """ A field with few values may be given without values. """
+        axes = parse_axes("binary_units\n\nbase: 2, 16\n")
+        self.assertEqual(axes[0][0], "binary_units")
+        self.assertEqual(len(axes[0][1]), 2)
+        self.assertEqual(axes[1], ("base", ["2", "16"]))
+
+    def testBad(self):
+        """ Unknown fields, bad values, and no axes are errors. """
+        for text in ("", "nosuchfield: 1", "base: ten", "base"):
+            with self.assertRaises(GUIValueError):
+                parse_axes(text)
+
+
+class MatrixRenderTestCase(unittest.TestCase):
+    """ Test rendering a matrix. """
+
+    def testAll(self):
+        """ Every combination is rendered exactly once. """
+        axes = parse_axes("binary_units\nbase: 2, 10, 16")
+        render = MatrixRender(
+           justbytes.Range(1024),
+           default_options(),
+           axes,
+           jobs=2,
+           use_threads=True
+        )
+        render.start()
+        results = []
+        for _ in range(500):
+            results.extend(render.results())
+            if render.done:
+                break
+            time.sleep(0.01)
+        self.assertTrue(render.done)
+        self.assertEqual(
+           sorted(index for (index, _, _) in results),
+           [(i, j) for i in range(2) for j in range(3)]
+        )
+        self.assertTrue(all(error is None for (_, _, error) in results))
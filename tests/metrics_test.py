@@ -0,0 +1,71 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for the latency statistics. """
+import json
+import unittest
+
+from justbytes_gui._errors import GUIValueError
+from justbytes_gui._metrics import LatencyStats
+from justbytes_gui._metrics import PHASES
+from justbytes_gui._metrics import Stopwatch
+
+
+class LatencyStatsTestCase(unittest.TestCase):
+    """ Test the latency statistics. """
+
+    def testPercentiles(self):
+        """ Percentiles are latencies that were recorded. """
+        stats = LatencyStats()
+        for i in range(1, 101):
+            stats.record({"render": i / 1000.0})
+        self.assertEqual(stats.percentile("render", 0), 0.001)
+        self.assertEqual(stats.percentile("render", 50), 0.051)
+        self.assertEqual(stats.percentile("render", 100), 0.1)
+        self.assertIsNone(stats.percentile("get", 50))
+
+    def testWindow(self):
+        """ Only the most recent latencies are kept. """
+        stats = LatencyStats(window=2)
+        for seconds in (3, 1, 2):
+            stats.record({"config": seconds})
+        self.assertEqual(stats.summary()["config"]["count"], 2)
+        self.assertEqual(stats.summary()["config"]["max"], 2)
+        with self.assertRaises(GUIValueError):
+            LatencyStats(window=0)
+
+    def testHook(self):
+        """ Hooks see the timings of every show. """
+        stats = LatencyStats()
+        seen = []
+        stats.add_hook(seen.append)
+        stats.record({"get": 1})
+        stats.remove_hook(seen.append)
+        stats.record({"get": 2})
+        self.assertEqual(seen, [{"get": 1}])
+
+    def testJSON(self):
+        """ The export has every phase. """
+        stats = LatencyStats()
+        watch = Stopwatch()
+        for phase in PHASES:
+            watch.lap(phase)
+        stats.record(watch.timings)
+        exported = json.loads(stats.to_json())
+        self.assertEqual(sorted(exported["phases"]), sorted(PHASES))
+        self.assertEqual(exported["phases"]["update"]["count"], 1)
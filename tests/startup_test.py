@@ -0,0 +1,58 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for the cost of importing the headless parts of the package. """
+import subprocess
+import sys
+import unittest
+
+
+# The most time, in seconds, that importing the headless modules may take,
+# measured in a fresh interpreter. It is about four times what it takes on
+# an ordinary machine, where justbytes accounts for most of it.
+STARTUP_TARGET = 0.25
+
+_SCRIPT = """
+import sys
+import time
+start = time.time()
+import justbytes_gui
+import justbytes_gui._batch
+import justbytes_gui._matrix
+elapsed = time.time() - start
+gui = [m for m in ("Tkinter", "tkinter", "justoptions_gui") if m in sys.modules]
+print("%f %s" % (elapsed, ",".join(gui)))
+"""
+
+
+class StartupTestCase(unittest.TestCase):
+    """ Test importing the headless modules. """
+
+    def setUp(self):
+        output = subprocess.check_output([sys.executable, "-c", _SCRIPT])
+        (elapsed, _, gui) = output.decode().strip().partition(" ")
+        self.elapsed = float(elapsed)
+        self.gui = gui
+
+    def testNoGUI(self):
+        """ No GUI module is imported. """
+        self.assertEqual(self.gui, "")
+
+    def testTime(self):
+        """ Importing takes less than the target time. """
+        self.assertLess(self.elapsed, STARTUP_TARGET)
@@ -0,0 +1,74 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for choosing units. """
+import itertools
+import unittest
+
+from fractions import Fraction
+
+import justbytes
+
+from justbytes_gui._units import UnitIndex
+from justbytes_gui._units import unit_index
+
+
+class UnitIndexTestCase(unittest.TestCase):
+    """ Test the unit index. """
+
+    def testComponents(self):
+        """ The components are those of justbytes. """
+        values = [
+           0, 1, 999, 1000, 1023, 1024, 1025, -2048, 10 ** 6, 2 ** 20 + 1,
+           3 * 10 ** 12, 2 ** 70, 5 ** 30, Fraction(1, 3), Fraction(-3072, 5)
+        ]
+        configs = itertools.product(
+           [True, False],
+           [True, False],
+           [0, 2, 10],
+           [2, 10, 16],
+           [1, Fraction(1, 10), 1000]
+        )
+        for (binary, exact, places, base, minimum) in configs:
+            config = justbytes.ValueConfig(
+               base=base,
+               binary_units=binary,
+               exact_value=exact,
+               max_places=places,
+               min_value=minimum
+            )
+            index = unit_index(binary, minimum)
+            for value in values:
+                value = justbytes.Range(value)
+                self.assertEqual(
+                   index.components(value, config),
+                   value.components(config)
+                )
+
+    def testThresholds(self):
+        """ A value is shown in the first unit in which it is small. """
+        index = UnitIndex(binary_units=False)
+        self.assertEqual(index.units[index.index(999)], justbytes.B)
+        self.assertEqual(index.units[index.index(1000)], justbytes.KB)
+        self.assertEqual(index.units[index.index(Fraction(1999, 2))], justbytes.B)
+        self.assertEqual(index.units[index.index(10 ** 30)], justbytes.YB)
+
+    def testShared(self):
+        """ Indices are shared. """
+        self.assertIs(unit_index(True, 1), unit_index(True, Fraction(1)))
+        self.assertIsNot(unit_index(True, 1), unit_index(False, 1))
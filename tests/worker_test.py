@@ -0,0 +1,86 @@
+# Copyright (C) 2016  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Test for the render worker. """
+import threading
+import time
+import unittest
+
+from justbytes_gui._worker import RenderWorker
+
+
+def _wait(worker):
+    """
+    Poll ``worker`` until there is a result or a second has passed.
+
+    :returns: the result or None
+    """
+    for _ in range(100):
+        result = worker.poll()
+        if result is not None:
+            return result
+        time.sleep(0.01)
+    return None
+
+
+class RenderWorkerTestCase(unittest.TestCase):
+    """ Test the render worker. """
+
+    def setUp(self):
+        self.worker = RenderWorker()
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def testResult(self):
+        """ The result of a job is returned. """
+        self.worker.submit(lambda: 2)
+        self.assertEqual(_wait(self.worker).value, 2)
+
+    def testError(self):
+        """ An exception is returned, not raised. """
+        def job():
+            """ A failing job. """
+            raise ValueError()
+        self.worker.submit(job)
+        self.assertIsInstance(_wait(self.worker).error, ValueError)
+
+    def testSuperseded(self):
+        """ Only the latest job's result is seen. """
+        started = threading.Event()
+        release = threading.Event()
+        def slow():
+            """ A job that waits to be released. """
+            started.set()
+            release.wait()
+            return "slow"
+        self.worker.submit(slow)
+        started.wait()
+        self.worker.submit(lambda: "pending")
+        self.worker.submit(lambda: "latest")
+        release.set()
+        self.assertEqual(_wait(self.worker).value, "latest")
+
+    def testCancel(self):
+        """ A cancelled job has no result. """
+        release = threading.Event()
+        self.worker.submit(release.wait)
+        self.worker.cancel()
+        release.set()
+        time.sleep(0.05)
+        self.assertIsNone(self.worker.poll())